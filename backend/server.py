@@ -1,18 +1,23 @@
+import asyncio
 import os
+import time
 import uuid
-from datetime import date, datetime, timedelta
-from typing import Any, Dict, List, Literal, Optional, Tuple
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Dict, List, Literal, NamedTuple, Optional, Tuple
 
 from dotenv import load_dotenv
 from fastapi import BackgroundTasks, FastAPI, File, HTTPException, Query, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import Response
 
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 
-from motor.motor_asyncio import AsyncIOMotorClient
 from pydantic import BaseModel, Field
+from pymongo import AsyncMongoClient, ReturnDocument
+from pymongo.errors import CollectionInvalid
 
 load_dotenv()
 
@@ -22,21 +27,34 @@ APP_TITLE = "2026 Accountability Tracker"
 # Helpers
 # -----------------------------
 
-def now_utc() -> datetime:
-    return datetime.utcnow()
+def now_iso() -> str:
+    # Timezone-aware (utcnow() is deprecated); fixed-width microseconds so
+    # created_at strings keep sorting correctly within the same second.
+    return datetime.now(timezone.utc).isoformat(timespec="microseconds")
 
 
+# The same handful of days (today, week/month bounds, query params) recur on every
+# request, so both directions of the date <-> YYYY-MM-DD conversion are memoized.
+@lru_cache(maxsize=4096)
 def iso_date(d: date) -> str:
     return d.isoformat()
 
 
+@lru_cache(maxsize=4096)
+def _parse_iso(s: str) -> date:
+    return date.fromisoformat(s)
+
+
 def parse_date(s: str) -> date:
     try:
-        return date.fromisoformat(s)
+        return _parse_iso(s)
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Invalid date format: {s}. Use YYYY-MM-DD") from e
 
 
+ONE_DAY = timedelta(days=1)
+
+
 def new_id() -> str:
     return str(uuid.uuid4())
 
@@ -47,6 +65,46 @@ def clamp_float(v: float, min_v: float, max_v: float, label: str) -> float:
     return v
 
 
+# Small in-process TTL cache for rarely-changing reads (single-user app).
+# Writers call cache_invalidate() for the namespaces they touch; the TTL only bounds
+# staleness for writes made outside this process.
+# Readers grab cache_generation() before querying and hand it to cache_set(), so a
+# result computed while a write was invalidating is not stored.
+RESPONSE_CACHE_TTL_SECONDS = 30.0
+_response_cache: Dict[str, Tuple[float, Any]] = {}
+_cache_generation = 0
+
+
+def cache_generation() -> int:
+    return _cache_generation
+
+
+def cache_get(key: str) -> Optional[Any]:
+    hit = _response_cache.get(key)
+    if hit is None:
+        return None
+    expires_at, value = hit
+    if time.monotonic() >= expires_at:
+        _response_cache.pop(key, None)
+        return None
+    return value
+
+
+def cache_set(key: str, value: Any, generation: int, ttl: float = RESPONSE_CACHE_TTL_SECONDS) -> None:
+    if generation != _cache_generation:
+        return
+    _response_cache[key] = (time.monotonic() + ttl, value)
+
+
+def cache_invalidate(*namespaces: str) -> None:
+    # Drops `ns` itself and any `ns:<suffix>` keys
+    global _cache_generation
+    _cache_generation += 1
+    for key in list(_response_cache):
+        if any(key == ns or key.startswith(ns + ":") for ns in namespaces):
+            del _response_cache[key]
+
+
 import hashlib
 
 
@@ -255,7 +313,7 @@ class WeeklyReviewResponse(BaseModel):
 # App + DB
 # -----------------------------
 
-app = FastAPI(title=APP_TITLE)
+app = FastAPI(title=APP_TITLE, default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -275,7 +333,7 @@ if not MONGO_URL:
     # This should be set via backend/.env in this environment.
     raise RuntimeError("MONGO_URL is not set")
 
-mongo_client: Optional[AsyncIOMotorClient] = None
+mongo_client: Optional[AsyncMongoClient] = None
 mongo_db = None
 
 # -----------------------------
@@ -362,12 +420,151 @@ async def auth_login(payload: AuthRequest) -> Dict[str, Any]:
 DEFAULT_MORTGAGE_START_PRINCIPAL = 330000.0
 DEFAULT_MORTGAGE_TARGET_PRINCIPAL = 299999.0
 
+# metrics / mortgage_events index for "latest of kind" lookups and kind + day-range
+# aggregations. With the (day, kind) index also present the planner can pick a day scan
+# that filters on kind, so the hot queries hint this one.
+KIND_DAY_INDEX = [("kind", 1), ("day", -1)]
+# aggregate() sends hint as-is (no key-list conversion), so it needs the key document
+KIND_DAY_HINT = dict(KIND_DAY_INDEX)
+
+# Trip history is a capped collection: bounded, and kept in insertion order
+TRIP_HISTORY_MAX_BYTES = 1 << 20
+TRIP_HISTORY_MAX_DOCS = 1000
+
+
+async def ensure_trip_history_capped() -> None:
+    if await mongo_db.list_collection_names(filter={"name": "trip_history"}):
+        opts = await mongo_db.trip_history.options()
+        if not opts.get("capped"):
+            # Existing deployments: convertToCapped only supports a size bound
+            await mongo_db.command("convertToCapped", "trip_history", size=TRIP_HISTORY_MAX_BYTES)
+        return
+    try:
+        await mongo_db.create_collection("trip_history", capped=True, size=TRIP_HISTORY_MAX_BYTES, max=TRIP_HISTORY_MAX_DOCS)
+    except CollectionInvalid:
+        # Created concurrently by another worker
+        pass
+
+
+# Denormalized "latest entry" fields live on one small state doc so the summary reads a
+# single document instead of a sorted query per kind. The raw collections stay the
+# history; the state doc is a pre-aggregated cache maintained by the write endpoints.
+STATE_ID = "default"
+STATE_LATEST_FIELDS = ("latest_weight", "latest_body_fat", "latest_balance_check")
+
+
+async def record_latest(field: str, day_iso: str, value: float) -> None:
+    # Replace {day, value} only if this entry is not older than the stored one, so a
+    # back-dated entry never overwrites a newer one. A missing field sorts below any string.
+    await mongo_db.state.update_one(
+        {"_id": STATE_ID},
+        [
+            {
+                "$set": {
+                    field: {
+                        "$cond": [
+                            {"$lte": [f"${field}.day", day_iso]},
+                            {"day": day_iso, "value": value},
+                            f"${field}",
+                        ]
+                    }
+                }
+            }
+        ],
+        upsert=True,
+    )
+
+
+async def fetch_state_latest() -> Dict[str, Any]:
+    # Every "latest of kind" read goes through the state doc: one _id lookup
+    state = await mongo_db.state.find_one({"_id": STATE_ID}, {field: 1 for field in STATE_LATEST_FIELDS})
+    return state or {}
+
+
+async def fetch_latest_entries() -> Dict[str, Dict[str, Any]]:
+    # Latest weight / body fat / balance check straight from the raw collections, in one
+    # round-trip. Each $unionWith branch opens with its own $match/$sort/$limit, so each
+    # still uses its collection's (kind, day) index. Only the top-level pipeline accepts a
+    # hint; $unionWith branches are planned on their own.
+    cursor = await mongo_db.metrics.aggregate(
+        [
+            {"$match": {"kind": "weight"}},
+            {"$sort": {"day": -1}},
+            {"$limit": 1},
+            {"$project": {"_id": 0, "slot": {"$literal": "latest_weight"}, "day": 1, "value": 1}},
+            {
+                "$unionWith": {
+                    "coll": "metrics",
+                    "pipeline": [
+                        {"$match": {"kind": {"$in": ["body_fat", "waist"]}}},
+                        {"$sort": {"day": -1}},
+                        {"$limit": 1},
+                        {"$project": {"_id": 0, "slot": {"$literal": "latest_body_fat"}, "day": 1, "value": 1}},
+                    ],
+                }
+            },
+            {
+                "$unionWith": {
+                    "coll": "mortgage_events",
+                    "pipeline": [
+                        {"$match": {"kind": "balance_check"}},
+                        {"$sort": {"day": -1}},
+                        {"$limit": 1},
+                        {"$project": {"_id": 0, "slot": {"$literal": "latest_balance_check"}, "day": 1, "value": "$amount"}},
+                    ],
+                }
+            },
+        ],
+        hint=KIND_DAY_HINT,
+    )
+    return {doc.pop("slot"): doc for doc in await cursor.to_list(None)}
+
+
+async def ensure_state_doc() -> None:
+    # Reconcile from the raw collections on every start. The write endpoints update the
+    # state doc after their insert, so a failed or interrupted second write leaves it stale;
+    # this heals any drift (and backfills existing deployments). Kinds with no entries are unset.
+    latest = await fetch_latest_entries()
+    update: Dict[str, Any] = {}
+    if latest:
+        update["$set"] = latest
+    missing = {field: "" for field in STATE_LATEST_FIELDS if field not in latest}
+    if missing:
+        update["$unset"] = missing
+    await mongo_db.state.update_one({"_id": STATE_ID}, update, upsert=True)
+
+
+# Per-month gift / photo counts, {_id: "YYYY-MM", gifts: N, photos: N}, bumped with $inc on
+# every write so the summary's monthly reminders are one _id lookup instead of a recount.
+def month_key(day_iso: str) -> str:
+    return day_iso[:7]
+
+
+async def bump_monthly_rollup(day_iso: str, field: str) -> None:
+    await mongo_db.monthly_rollups.update_one({"_id": month_key(day_iso)}, {"$inc": {field: 1}}, upsert=True)
+
+
+async def ensure_monthly_rollups() -> None:
+    # Recount photos and gifts per month and replace each month's rollup, on every start.
+    # The write endpoints $inc after their insert, so a lost $inc would otherwise never be
+    # corrected; the recount is idempotent (and backfills existing deployments).
+    cursor = await mongo_db.photos.aggregate(
+        [
+            {"$project": {"_id": 0, "month": {"$substrBytes": ["$day", 0, 7]}, "photos": {"$literal": 1}}},
+            {"$unionWith": {"coll": "gifts", "pipeline": [{"$project": {"_id": 0, "month": {"$substrBytes": ["$day", 0, 7]}, "gifts": {"$literal": 1}}}]}},
+            {"$group": {"_id": "$month", "photos": {"$sum": "$photos"}, "gifts": {"$sum": "$gifts"}}},
+            {"$merge": {"into": "monthly_rollups", "on": "_id", "whenMatched": "replace", "whenNotMatched": "insert"}},
+        ]
+    )
+    await cursor.to_list(None)
+
 
 @app.on_event("startup")
 async def on_startup() -> None:
     global mongo_client, mongo_db
-    mongo_client = AsyncIOMotorClient(MONGO_URL)
+    mongo_client = AsyncMongoClient(MONGO_URL)
     mongo_db = mongo_client.get_default_database()  # from URI path
+    ts = now_iso()
 
     # Ensure baseline settings doc exists
     await mongo_db.settings.update_one(
@@ -378,7 +575,7 @@ async def on_startup() -> None:
                 "mortgage_start_principal": DEFAULT_MORTGAGE_START_PRINCIPAL,
                 "mortgage_target_principal": DEFAULT_MORTGAGE_TARGET_PRINCIPAL,
                 "mortgage_current_principal": None,
-                "updated_at": now_utc().isoformat(),
+                "updated_at": ts,
             }
         },
         upsert=True,
@@ -397,25 +594,33 @@ async def on_startup() -> None:
                 "lodging_booked": False,
                 "childcare_confirmed": False,
                 "notes": "",
-                "updated_at": now_utc().isoformat(),
+                "updated_at": ts,
             }
         },
         upsert=True,
     )
 
     # Basic indexes
+    # `day` is stored as a YYYY-MM-DD string everywhere (it is also the API format).
+    # Fixed-width ISO dates sort lexicographically in date order, so these indexes
+    # serve day range filters and day sorts as plain index range scans.
     await mongo_db.checkins.create_index("day", unique=True)
     await mongo_db.metrics.create_index([("day", 1), ("kind", 1)])
     await mongo_db.mortgage_events.create_index([("day", 1), ("kind", 1)])
+    await mongo_db.metrics.create_index(KIND_DAY_INDEX)
+    await mongo_db.mortgage_events.create_index(KIND_DAY_INDEX)
     await mongo_db.gifts.create_index("day")
-    await mongo_db.trip_history.create_index([("trip_id", 1), ("created_at", -1)])
+    await mongo_db.photos.create_index("day")
+    await ensure_trip_history_capped()
+    await ensure_state_doc()
+    await ensure_monthly_rollups()
 
 
 @app.on_event("shutdown")
 async def on_shutdown() -> None:
     global mongo_client
     if mongo_client is not None:
-        mongo_client.close()
+        await mongo_client.close()
 
 
 @app.get("/api/health")
@@ -443,28 +648,32 @@ async def admin_reset(confirm: str = Query(..., description="Must be 'RESET'"))
         "trip_history",
     ]
 
-    deleted = {}
-    for c in collections_to_clear:
-        res = await mongo_db[c].delete_many({})
-        deleted[c] = res.deleted_count
-
-    # reset trip to defaults
-    await mongo_db.trip.update_one(
-        {"_id": "default"},
-        {
-            "$set": {
-                "start_date": "",
-                "end_date": "",
-                "dates": "",
-                "adults_only": True,
-                "lodging_booked": False,
-                "childcare_confirmed": False,
-                "notes": "",
-                "updated_at": now_utc().isoformat(),
-            }
-        },
-        upsert=True,
+    # Every op targets a different collection, so run them all concurrently
+    *delete_results, _, _, _ = await asyncio.gather(
+        *(mongo_db[c].delete_many({}) for c in collections_to_clear),
+        # reset trip to defaults
+        mongo_db.trip.update_one(
+            {"_id": "default"},
+            {
+                "$set": {
+                    "start_date": "",
+                    "end_date": "",
+                    "dates": "",
+                    "adults_only": True,
+                    "lodging_booked": False,
+                    "childcare_confirmed": False,
+                    "notes": "",
+                    "updated_at": now_iso(),
+                }
+            },
+            upsert=True,
+        ),
+        # the derived state doc and rollups go with the data they summarize
+        mongo_db.state.delete_one({"_id": STATE_ID}),
+        mongo_db.monthly_rollups.delete_many({}),
     )
+    deleted = {c: res.deleted_count for c, res in zip(collections_to_clear, delete_results)}
+    cache_invalidate("summary", "mortgage", "trip")
 
     return {
         "ok": True,
@@ -477,42 +686,42 @@ async def admin_reset(confirm: str = Query(..., description="Must be 'RESET'"))
 # Check-ins
 # -----------------------------
 
+# Projections: only fetch the fields the responses echo
+CHECKIN_FIELDS = {"_id": 1, "day": 1, "wakeup_5am": 1, "workout": 1, "video_captured": 1, "notes": 1, "created_at": 1, "updated_at": 1}
+METRIC_FIELDS = {"_id": 1, "day": 1, "kind": 1, "value": 1, "created_at": 1}
+PHOTO_FIELDS = {"_id": 1, "day": 1, "filename": 1, "url": 1, "created_at": 1}
+MORTGAGE_EVENT_FIELDS = {"_id": 1, "day": 1, "kind": 1, "amount": 1, "note": 1, "created_at": 1}
+GIFT_FIELDS = {"_id": 1, "day": 1, "description": 1, "amount": 1, "created_at": 1}
+
+
 @app.post("/api/checkins/upsert", response_model=CheckIn)
 async def upsert_checkin(payload: CheckInUpsertRequest) -> CheckIn:
     d = parse_date(payload.day)
-    ts = now_utc().isoformat()
+    ts = now_iso()
 
-    existing = await mongo_db.checkins.find_one({"day": iso_date(d)})
-    if existing:
-        await mongo_db.checkins.update_one(
-            {"_id": existing["_id"]},
-            {
-                "$set": {
-                    "wakeup_5am": payload.wakeup_5am,
-                    "workout": payload.workout,
-                    "video_captured": payload.video_captured,
-                    "notes": payload.notes or "",
-                    "updated_at": ts,
-                }
+    # Single atomic round-trip; insert-only fields go in $setOnInsert
+    doc = await mongo_db.checkins.find_one_and_update(
+        {"day": iso_date(d)},
+        {
+            "$set": {
+                "wakeup_5am": payload.wakeup_5am,
+                "workout": payload.workout,
+                "video_captured": payload.video_captured,
+                "notes": payload.notes or "",
+                "updated_at": ts,
             },
-        )
-        doc = await mongo_db.checkins.find_one({"_id": existing["_id"]})
-    else:
-        _id = new_id()
-        doc_in = {
-            "_id": _id,
-            "day": iso_date(d),
-            "wakeup_5am": payload.wakeup_5am,
-            "workout": payload.workout,
-            "video_captured": payload.video_captured,
-            "notes": payload.notes or "",
-            "created_at": ts,
-            "updated_at": ts,
-        }
-        await mongo_db.checkins.insert_one(doc_in)
-        doc = doc_in
+            "$setOnInsert": {
+                "_id": new_id(),
+                "created_at": ts,
+            },
+        },
+        upsert=True,
+        return_document=ReturnDocument.AFTER,
+    )
+    cache_invalidate("summary")
 
-    return CheckIn(
+    # Trusted doc we just wrote; skip field validation on construction
+    return CheckIn.model_construct(
         id=doc["_id"],
         day=doc["day"],
         wakeup_5am=doc["wakeup_5am"],
@@ -528,28 +737,29 @@ async def upsert_checkin(payload: CheckInUpsertRequest) -> CheckIn:
 async def list_checkins(
     start: str = Query(..., description="YYYY-MM-DD"),
     end: str = Query(..., description="YYYY-MM-DD"),
-) -> List[CheckIn]:
+) -> ORJSONResponse:
     ds = parse_date(start)
     de = parse_date(end)
     if de < ds:
         raise HTTPException(status_code=400, detail="end must be >= start")
 
-    cursor = mongo_db.checkins.find({"day": {"$gte": iso_date(ds), "$lte": iso_date(de)}}).sort("day", 1)
-    out: List[CheckIn] = []
+    cursor = mongo_db.checkins.find({"day": {"$gte": iso_date(ds), "$lte": iso_date(de)}}, CHECKIN_FIELDS).sort("day", 1)
+    # Docs are already response-shaped; skip model construction + jsonable_encoder.
+    out: List[Dict[str, Any]] = []
     async for doc in cursor:
         out.append(
-            CheckIn(
-                id=doc["_id"],
-                day=doc["day"],
-                wakeup_5am=doc["wakeup_5am"],
-                workout=doc["workout"],
-                video_captured=doc["video_captured"],
-                notes=doc.get("notes", ""),
-                created_at=doc.get("created_at", doc.get("updated_at", "")),
-                updated_at=doc.get("updated_at", doc.get("created_at", "")),
-            )
+            {
+                "id": doc["_id"],
+                "day": doc["day"],
+                "wakeup_5am": doc["wakeup_5am"],
+                "workout": doc["workout"],
+                "video_captured": doc["video_captured"],
+                "notes": doc.get("notes", ""),
+                "created_at": doc.get("created_at", doc.get("updated_at", "")),
+                "updated_at": doc.get("updated_at", doc.get("created_at", "")),
+            }
         )
-    return out
+    return ORJSONResponse(out)
 
 
 # -----------------------------
@@ -560,9 +770,11 @@ async def list_checkins(
 async def add_weight(payload: WeightEntryCreate) -> MetricEntry:
     d = parse_date(payload.day)
     v = clamp_float(payload.weight_lbs, 80, 400, "weight_lbs")
-    ts = now_utc().isoformat()
+    ts = now_iso()
     doc = {"_id": new_id(), "day": iso_date(d), "kind": "weight", "value": v, "created_at": ts}
     await mongo_db.metrics.insert_one(doc)
+    await record_latest("latest_weight", doc["day"], v)
+    cache_invalidate("summary")
     return MetricEntry(id=doc["_id"], day=doc["day"], kind="weight", value=v, created_at=ts)
 
 
@@ -570,9 +782,11 @@ async def add_weight(payload: WeightEntryCreate) -> MetricEntry:
 async def add_body_fat(payload: BodyFatEntryCreate) -> MetricEntry:
     d = parse_date(payload.day)
     v = clamp_float(payload.body_fat_pct, 3, 70, "body_fat_pct")
-    ts = now_utc().isoformat()
+    ts = now_iso()
     doc = {"_id": new_id(), "day": iso_date(d), "kind": "body_fat", "value": v, "created_at": ts}
     await mongo_db.metrics.insert_one(doc)
+    await record_latest("latest_body_fat", doc["day"], v)
+    cache_invalidate("summary")
     return MetricEntry(id=doc["_id"], day=doc["day"], kind="body_fat", value=v, created_at=ts)
 
 
@@ -582,6 +796,27 @@ async def add_waist(payload: WaistEntryCreate) -> MetricEntry:
     return await add_body_fat(BodyFatEntryCreate(day=payload.day, body_fat_pct=payload.waist_in))
 
 
+ALLOWED_PHOTO_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png", ".webp"})
+MAX_PHOTO_BYTES = 10 * 1024 * 1024
+UPLOAD_CHUNK_BYTES = 1 << 16
+
+
+def save_upload(src, full_path: str, max_bytes: int) -> bool:
+    # Copy in chunks so a large upload is never fully buffered in memory.
+    # Returns False (and removes the partial file) if the upload exceeds max_bytes.
+    total = 0
+    with open(full_path, "wb") as f:
+        while chunk := src.read(UPLOAD_CHUNK_BYTES):
+            total += len(chunk)
+            if total > max_bytes:
+                break
+            f.write(chunk)
+    if total > max_bytes:
+        os.unlink(full_path)
+        return False
+    return True
+
+
 @app.post("/api/fitness/photo", response_model=PhotoEntry)
 async def upload_photo(day: str = Query(...), file: UploadFile = File(...)) -> PhotoEntry:
     d = parse_date(day)
@@ -589,24 +824,24 @@ async def upload_photo(day: str = Query(...), file: UploadFile = File(...)) -> P
         raise HTTPException(status_code=400, detail="Missing filename")
 
     ext = os.path.splitext(file.filename)[1].lower()
-    if ext not in [".jpg", ".jpeg", ".png", ".webp"]:
+    if ext not in ALLOWED_PHOTO_EXTENSIONS:
         raise HTTPException(status_code=400, detail="Supported types: .jpg, .jpeg, .png, .webp")
 
+    day_iso = iso_date(d)
     _id = new_id()
-    safe_name = f"{iso_date(d)}-{_id}{ext}"
+    safe_name = f"{day_iso}-{_id}{ext}"
     full_path = os.path.join(UPLOAD_DIR, safe_name)
 
-    contents = await file.read()
-    if len(contents) > 10 * 1024 * 1024:
+    # Blocking file IO runs in the threadpool so it doesn't stall the event loop
+    if not await run_in_threadpool(save_upload, file.file, full_path, MAX_PHOTO_BYTES):
         raise HTTPException(status_code=400, detail="File too large (max 10MB)")
 
-    with open(full_path, "wb") as f:
-        f.write(contents)
-
-    ts = now_utc().isoformat()
+    ts = now_iso()
     url = f"/api/uploads/{safe_name}"
-    doc = {"_id": _id, "day": iso_date(d), "filename": safe_name, "url": url, "created_at": ts}
+    doc = {"_id": _id, "day": day_iso, "filename": safe_name, "url": url, "created_at": ts}
     await mongo_db.photos.insert_one(doc)
+    await bump_monthly_rollup(day_iso, "photos")
+    cache_invalidate("summary")
     return PhotoEntry(id=_id, day=doc["day"], filename=safe_name, url=url, created_at=ts)
 
 
@@ -614,14 +849,16 @@ async def upload_photo(day: str = Query(...), file: UploadFile = File(...)) -> P
 async def get_fitness_metrics(
     start: str = Query(...),
     end: str = Query(...),
-) -> Dict[str, Any]:
+) -> ORJSONResponse:
     ds = parse_date(start)
     de = parse_date(end)
     if de < ds:
         raise HTTPException(status_code=400, detail="end must be >= start")
 
+    ds_iso, de_iso = iso_date(ds), iso_date(de)
+
     metrics: List[Dict[str, Any]] = []
-    async for doc in mongo_db.metrics.find({"day": {"$gte": iso_date(ds), "$lte": iso_date(de)}}).sort("day", 1):
+    async for doc in mongo_db.metrics.find({"day": {"$gte": ds_iso, "$lte": de_iso}}, METRIC_FIELDS).sort("day", 1):
         kind = doc.get("kind")
         # Migrate old kind name in responses
         if kind == "waist":
@@ -629,20 +866,23 @@ async def get_fitness_metrics(
         metrics.append({"id": doc["_id"], "day": doc["day"], "kind": kind, "value": doc["value"], "created_at": doc["created_at"]})
 
     photos: List[Dict[str, Any]] = []
-    async for doc in mongo_db.photos.find({"day": {"$gte": iso_date(ds), "$lte": iso_date(de)}}).sort("day", 1):
+    async for doc in mongo_db.photos.find({"day": {"$gte": ds_iso, "$lte": de_iso}}, PHOTO_FIELDS).sort("day", 1):
         photos.append({"id": doc["_id"], "day": doc["day"], "filename": doc["filename"], "url": doc["url"], "created_at": doc["created_at"]})
 
-    latest_weight = await mongo_db.metrics.find({"kind": "weight"}).sort("day", -1).limit(1).to_list(length=1)
-    latest_bf = await mongo_db.metrics.find({"kind": {"$in": ["body_fat", "waist"]}}).sort("day", -1).limit(1).to_list(length=1)
+    state = await fetch_state_latest()
+    latest_weight = state.get("latest_weight")
+    latest_bf = state.get("latest_body_fat")
 
-    return {
-        "metrics": metrics,
-        "photos": photos,
-        "latest": {
-            "weight_lbs": latest_weight[0]["value"] if latest_weight else None,
-            "body_fat_pct": latest_bf[0]["value"] if latest_bf else None,
-        },
-    }
+    return ORJSONResponse(
+        {
+            "metrics": metrics,
+            "photos": photos,
+            "latest": {
+                "weight_lbs": latest_weight["value"] if latest_weight else None,
+                "body_fat_pct": latest_bf["value"] if latest_bf else None,
+            },
+        }
+    )
 
 
 # -----------------------------
@@ -653,7 +893,7 @@ async def get_fitness_metrics(
 async def add_principal_payment(payload: PrincipalPaymentCreate) -> MortgageEvent:
     d = parse_date(payload.day)
     amt = clamp_float(payload.amount, 1, 1_000_000, "amount")
-    ts = now_utc().isoformat()
+    ts = now_iso()
     doc = {
         "_id": new_id(),
         "day": iso_date(d),
@@ -663,6 +903,7 @@ async def add_principal_payment(payload: PrincipalPaymentCreate) -> MortgageEven
         "created_at": ts,
     }
     await mongo_db.mortgage_events.insert_one(doc)
+    cache_invalidate("summary", "mortgage")
     return MortgageEvent(id=doc["_id"], day=doc["day"], kind="principal_payment", amount=amt, note=doc["note"], created_at=ts)
 
 
@@ -670,7 +911,7 @@ async def add_principal_payment(payload: PrincipalPaymentCreate) -> MortgageEven
 async def add_balance_check(payload: BalanceCheckCreate) -> MortgageEvent:
     d = parse_date(payload.day)
     bal = clamp_float(payload.principal_balance, 1, 10_000_000, "principal_balance")
-    ts = now_utc().isoformat()
+    ts = now_iso()
     doc = {
         "_id": new_id(),
         "day": iso_date(d),
@@ -680,32 +921,69 @@ async def add_balance_check(payload: BalanceCheckCreate) -> MortgageEvent:
         "created_at": ts,
     }
     await mongo_db.mortgage_events.insert_one(doc)
+    await record_latest("latest_balance_check", doc["day"], bal)
+    cache_invalidate("summary", "mortgage")
     return MortgageEvent(id=doc["_id"], day=doc["day"], kind="balance_check", amount=bal, note=doc["note"], created_at=ts)
 
 
 @app.get("/api/mortgage/events", response_model=List[MortgageEvent])
-async def list_mortgage_events(start: str = Query(...), end: str = Query(...)) -> List[MortgageEvent]:
+async def list_mortgage_events(start: str = Query(...), end: str = Query(...)) -> ORJSONResponse:
     ds = parse_date(start)
     de = parse_date(end)
-    cursor = mongo_db.mortgage_events.find({"day": {"$gte": iso_date(ds), "$lte": iso_date(de)}}).sort("day", 1)
-    out: List[MortgageEvent] = []
+    cursor = mongo_db.mortgage_events.find({"day": {"$gte": iso_date(ds), "$lte": iso_date(de)}}, MORTGAGE_EVENT_FIELDS).sort("day", 1)
+    out: List[Dict[str, Any]] = []
     async for doc in cursor:
         out.append(
-            MortgageEvent(
-                id=doc["_id"],
-                day=doc["day"],
-                kind=doc["kind"],
-                amount=float(doc["amount"]),
-                note=doc.get("note", ""),
-                created_at=doc.get("created_at", ""),
-            )
+            {
+                "id": doc["_id"],
+                "day": doc["day"],
+                "kind": doc["kind"],
+                "amount": float(doc["amount"]),
+                "note": doc.get("note", ""),
+                "created_at": doc.get("created_at", ""),
+            }
         )
-    return out
+    return ORJSONResponse(out)
 
 
 @app.get("/api/mortgage/summary")
 async def mortgage_summary() -> Dict[str, Any]:
-    settings = await get_settings_doc()
+    return await compute_mortgage_summary(date.today())
+
+
+async def compute_mortgage_summary(today: date) -> Dict[str, Any]:
+    # `today` is passed in so /api/summary computes everything against one date
+    today_iso = iso_date(today)
+    cache_key = f"mortgage:{today_iso}"
+    cached = cache_get(cache_key)
+    if cached is not None:
+        return cached
+    generation = cache_generation()
+
+    y_start = date(today.year, 1, 1)
+    m_start = date(today.year, today.month, 1)
+    y_iso, m_iso = iso_date(y_start), iso_date(m_start)
+
+    # YTD and MTD principal sums in one pass over this year's payments; the latest
+    # balance check (any year) comes from the state doc.
+    settings, payments_cursor, state = await asyncio.gather(
+        get_settings_doc(),
+        mongo_db.mortgage_events.aggregate(
+            [
+                {"$match": {"kind": "principal_payment", "day": {"$gte": y_iso, "$lte": today_iso}}},
+                {
+                    "$group": {
+                        "_id": None,
+                        "ytd": {"$sum": "$amount"},
+                        "mtd": {"$sum": {"$cond": [{"$gte": ["$day", m_iso]}, "$amount", 0]}},
+                    }
+                },
+            ],
+            hint=KIND_DAY_HINT,
+        ),
+        fetch_state_latest(),
+    )
+    payments = await payments_cursor.to_list(1)
 
     mortgage_start_principal = float(settings.get("mortgage_start_principal", DEFAULT_MORTGAGE_START_PRINCIPAL))
     mortgage_target_principal = float(settings.get("mortgage_target_principal", DEFAULT_MORTGAGE_TARGET_PRINCIPAL))
@@ -716,33 +994,15 @@ async def mortgage_summary() -> Dict[str, Any]:
     # 3) null
     explicit_current = settings.get("mortgage_current_principal", None)
 
-    latest_bal = await mongo_db.mortgage_events.find({"kind": "balance_check"}).sort("day", -1).limit(1).to_list(length=1)
-    latest_balance_check = float(latest_bal[0]["amount"]) if latest_bal else None
+    latest_bal = state.get("latest_balance_check")
+    latest_balance_check = float(latest_bal["value"]) if latest_bal else None
 
     latest_principal_balance = float(explicit_current) if explicit_current is not None else latest_balance_check
 
-    today = date.today()
-    y_start = date(today.year, 1, 1)
-    m_start = date(today.year, today.month, 1)
+    principal_paid_extra_ytd = float(payments[0]["ytd"]) if payments else 0.0
+    principal_paid_extra_month = float(payments[0]["mtd"]) if payments else 0.0
 
-    ytd_payments = await mongo_db.mortgage_events.aggregate(
-        [
-            {"$match": {"kind": "principal_payment", "day": {"$gte": iso_date(y_start), "$lte": iso_date(today)}}},
-            {"$group": {"_id": None, "sum": {"$sum": "$amount"}}},
-        ]
-    ).to_list(length=1)
-
-    month_payments = await mongo_db.mortgage_events.aggregate(
-        [
-            {"$match": {"kind": "principal_payment", "day": {"$gte": iso_date(m_start), "$lte": iso_date(today)}}},
-            {"$group": {"_id": None, "sum": {"$sum": "$amount"}}},
-        ]
-    ).to_list(length=1)
-
-    principal_paid_extra_ytd = float(ytd_payments[0]["sum"]) if ytd_payments else 0.0
-    principal_paid_extra_month = float(month_payments[0]["sum"]) if month_payments else 0.0
-
-    return {
+    out = {
         "mortgage_start_principal": mortgage_start_principal,
         "mortgage_target_principal": mortgage_target_principal,
         "latest_principal_balance": latest_principal_balance,
@@ -753,6 +1013,8 @@ async def mortgage_summary() -> Dict[str, Any]:
             "paid_extra_ytd": principal_paid_extra_ytd,
         },
     }
+    cache_set(cache_key, out, generation)
+    return out
 
 
 # -----------------------------
@@ -761,6 +1023,11 @@ async def mortgage_summary() -> Dict[str, Any]:
 
 @app.get("/api/relationship/trip", response_model=TripState)
 async def get_trip() -> TripState:
+    cached = cache_get("trip")
+    if cached is not None:
+        return cached
+    generation = cache_generation()
+
     doc = await mongo_db.trip.find_one({"_id": "default"})
     if not doc:
         raise HTTPException(status_code=500, detail="Trip state missing")
@@ -771,7 +1038,7 @@ async def get_trip() -> TripState:
     # Back-compat: if only legacy `dates` exists, keep returning it
     legacy_dates = doc.get("dates", "")
 
-    return TripState(
+    out = TripState.model_construct(
         id=doc["_id"],
         start_date=start_date,
         end_date=end_date,
@@ -782,23 +1049,23 @@ async def get_trip() -> TripState:
         notes=doc.get("notes", ""),
         updated_at=doc.get("updated_at", ""),
     )
+    cache_set("trip", out, generation)
+    return out
 
 
 @app.put("/api/relationship/trip", response_model=TripState)
 async def update_trip(payload: TripUpdate) -> TripState:
     # write-through + history
     prev = await mongo_db.trip.find_one({"_id": "default"})
-    ts = now_utc().isoformat()
+    ts = now_iso()
 
     # Validate dates when provided
     sd = payload.start_date or ""
     ed = payload.end_date or ""
-    if sd:
-        _ = parse_date(sd)
-    if ed:
-        _ = parse_date(ed)
-    if sd and ed:
-        if parse_date(ed) < parse_date(sd):
+    sd_date = parse_date(sd) if sd else None
+    ed_date = parse_date(ed) if ed else None
+    if sd_date and ed_date:
+        if ed_date < sd_date:
             raise HTTPException(status_code=400, detail="end_date must be >= start_date")
 
     await mongo_db.trip.update_one(
@@ -819,18 +1086,18 @@ async def update_trip(payload: TripUpdate) -> TripState:
     )
 
     if prev:
-        # Save previous snapshot for audit/history
-        snap = TripState(
-            id=prev.get("_id", "default"),
-            start_date=prev.get("start_date", ""),
-            end_date=prev.get("end_date", ""),
-            dates=prev.get("dates", ""),
-            adults_only=bool(prev.get("adults_only", True)),
-            lodging_booked=bool(prev.get("lodging_booked", False)),
-            childcare_confirmed=bool(prev.get("childcare_confirmed", False)),
-            notes=prev.get("notes", ""),
-            updated_at=prev.get("updated_at", ts),
-        ).model_dump()
+        # Save previous snapshot for audit/history (same keys as TripState)
+        snap = {
+            "id": prev.get("_id", "default"),
+            "start_date": prev.get("start_date", ""),
+            "end_date": prev.get("end_date", ""),
+            "dates": prev.get("dates", ""),
+            "adults_only": bool(prev.get("adults_only", True)),
+            "lodging_booked": bool(prev.get("lodging_booked", False)),
+            "childcare_confirmed": bool(prev.get("childcare_confirmed", False)),
+            "notes": prev.get("notes", ""),
+            "updated_at": prev.get("updated_at", ts),
+        }
         await mongo_db.trip_history.insert_one({
             "_id": new_id(),
             "trip_id": "default",
@@ -838,24 +1105,37 @@ async def update_trip(payload: TripUpdate) -> TripState:
             "snapshot": snap,
         })
 
+    cache_invalidate("summary", "trip")
     return await get_trip()
 
 
 @app.get("/api/relationship/trip/history", response_model=List[TripHistoryEntry])
-async def trip_history(limit: int = Query(25, ge=1, le=200)) -> List[TripHistoryEntry]:
-    out: List[TripHistoryEntry] = []
-    cursor = mongo_db.trip_history.find({"trip_id": "default"}).sort("created_at", -1).limit(limit)
+async def trip_history(limit: int = Query(25, ge=1, le=200)) -> ORJSONResponse:
+    out: List[Dict[str, Any]] = []
+    # Capped collection: reverse natural order is newest-first without an index scan
+    cursor = mongo_db.trip_history.find({"trip_id": "default"}).sort("$natural", -1).limit(limit)
     async for doc in cursor:
         snap = doc.get("snapshot") or {}
         out.append(
-            TripHistoryEntry(
-                id=doc["_id"],
-                trip_id=doc.get("trip_id", "default"),
-                created_at=doc.get("created_at", ""),
-                snapshot=TripState(**snap),
-            )
+            {
+                "id": doc["_id"],
+                "trip_id": doc.get("trip_id", "default"),
+                "created_at": doc.get("created_at", ""),
+                # Older snapshots may predate some TripState fields; fill the model defaults.
+                "snapshot": {
+                    "id": snap["id"],
+                    "start_date": snap.get("start_date", ""),
+                    "end_date": snap.get("end_date", ""),
+                    "dates": snap.get("dates", ""),
+                    "adults_only": snap.get("adults_only", True),
+                    "lodging_booked": snap.get("lodging_booked", False),
+                    "childcare_confirmed": snap.get("childcare_confirmed", False),
+                    "notes": snap.get("notes", ""),
+                    "updated_at": snap.get("updated_at", ""),
+                },
+            }
         )
-    return out
+    return ORJSONResponse(out)
 
 
 @app.post("/api/relationship/gifts", response_model=GiftEntry)
@@ -867,76 +1147,70 @@ async def add_gift(payload: GiftCreate) -> GiftEntry:
     if amt < 0:
         raise HTTPException(status_code=400, detail="amount must be >= 0")
 
-    ts = now_utc().isoformat()
+    ts = now_iso()
     doc = {"_id": new_id(), "day": iso_date(d), "description": payload.description.strip(), "amount": amt, "created_at": ts}
     await mongo_db.gifts.insert_one(doc)
+    await bump_monthly_rollup(doc["day"], "gifts")
+    cache_invalidate("summary")
     return GiftEntry(id=doc["_id"], day=doc["day"], description=doc["description"], amount=amt, created_at=ts)
 
 
 @app.get("/api/relationship/gifts", response_model=List[GiftEntry])
-async def list_gifts(year: int = Query(...), month: int = Query(...)) -> List[GiftEntry]:
+async def list_gifts(year: int = Query(...), month: int = Query(...)) -> ORJSONResponse:
     if month < 1 or month > 12:
         raise HTTPException(status_code=400, detail="month must be 1-12")
     start = date(year, month, 1)
     if month == 12:
-        end = date(year + 1, 1, 1) - timedelta(days=1)
+        end = date(year + 1, 1, 1) - ONE_DAY
     else:
-        end = date(year, month + 1, 1) - timedelta(days=1)
+        end = date(year, month + 1, 1) - ONE_DAY
 
-    out: List[GiftEntry] = []
-    async for doc in mongo_db.gifts.find({"day": {"$gte": iso_date(start), "$lte": iso_date(end)}}).sort("day", -1):
-        out.append(GiftEntry(id=doc["_id"], day=doc["day"], description=doc["description"], amount=float(doc.get("amount", 0)), created_at=doc.get("created_at", "")))
-    return out
+    out: List[Dict[str, Any]] = []
+    async for doc in mongo_db.gifts.find({"day": {"$gte": iso_date(start), "$lte": iso_date(end)}}, GIFT_FIELDS).sort("day", -1):
+        out.append({"id": doc["_id"], "day": doc["day"], "description": doc["description"], "amount": float(doc.get("amount", 0)), "created_at": doc.get("created_at", "")})
+    return ORJSONResponse(out)
 
 
 # -----------------------------
 # Settings + Email (SendGrid placeholder)
 # -----------------------------
 
+SETTINGS_BACKFILL_FIELDS = ("mortgage_start_principal", "mortgage_target_principal", "mortgage_current_principal")
+
+
 async def get_settings_doc() -> Dict[str, Any]:
     doc = await mongo_db.settings.find_one({"_id": "default"})
-    if not doc:
-        await mongo_db.settings.insert_one(
+    if doc and all(k in doc for k in SETTINGS_BACKFILL_FIELDS):
+        return doc
+
+    # Missing doc, or an older doc missing the mortgage fields: insert/backfill defaults
+    # in one atomic round-trip. $ifNull keeps any value that is already set.
+    return await mongo_db.settings.find_one_and_update(
+        {"_id": "default"},
+        [
             {
-                "_id": "default",
-                "mortgage_start_principal": DEFAULT_MORTGAGE_START_PRINCIPAL,
-                "mortgage_target_principal": DEFAULT_MORTGAGE_TARGET_PRINCIPAL,
-                "mortgage_current_principal": None,
-                "updated_at": now_utc().isoformat(),
+                "$set": {
+                    "mortgage_start_principal": {"$ifNull": ["$mortgage_start_principal", DEFAULT_MORTGAGE_START_PRINCIPAL]},
+                    "mortgage_target_principal": {"$ifNull": ["$mortgage_target_principal", DEFAULT_MORTGAGE_TARGET_PRINCIPAL]},
+                    "mortgage_current_principal": {"$ifNull": ["$mortgage_current_principal", None]},
+                    "updated_at": now_iso(),
+                }
             }
-        )
-        doc = await mongo_db.settings.find_one({"_id": "default"})
-    else:
-        # Backfill defaults if older doc missing these fields
-        needs_backfill = False
-        if "mortgage_start_principal" not in doc:
-            needs_backfill = True
-        if "mortgage_target_principal" not in doc:
-            needs_backfill = True
-        if "mortgage_current_principal" not in doc:
-            needs_backfill = True
-
-        if needs_backfill:
-            await mongo_db.settings.update_one(
-                {"_id": "default"},
-                {
-                    "$set": {
-                        "mortgage_start_principal": float(doc.get("mortgage_start_principal", DEFAULT_MORTGAGE_START_PRINCIPAL)),
-                        "mortgage_target_principal": float(doc.get("mortgage_target_principal", DEFAULT_MORTGAGE_TARGET_PRINCIPAL)),
-                        "mortgage_current_principal": doc.get("mortgage_current_principal", None),
-                        "updated_at": now_utc().isoformat(),
-                    }
-                },
-            )
-            doc = await mongo_db.settings.find_one({"_id": "default"})
-
-    return doc
+        ],
+        upsert=True,
+        return_document=ReturnDocument.AFTER,
+    )
 
 
 @app.get("/api/settings", response_model=SettingsResponse)
 async def get_settings() -> SettingsResponse:
+    cached = cache_get("settings")
+    if cached is not None:
+        return cached
+    generation = cache_generation()
+
     doc = await get_settings_doc()
-    return SettingsResponse(
+    out = SettingsResponse.model_construct(
         id=doc["_id"],
         sendgrid_sender_email=doc.get("sendgrid_sender_email", ""),
         reminder_recipient_email=doc.get("reminder_recipient_email", ""),
@@ -949,6 +1223,8 @@ async def get_settings() -> SettingsResponse:
         mortgage_current_principal=(float(doc.get("mortgage_current_principal")) if doc.get("mortgage_current_principal") is not None else None),
         updated_at=doc.get("updated_at", ""),
     )
+    cache_set("settings", out, generation)
+    return out
 
 
 @app.put("/api/settings", response_model=SettingsResponse)
@@ -963,7 +1239,7 @@ async def update_settings(payload: SettingsUpdate) -> SettingsResponse:
     if mc is not None:
         mc = clamp_float(float(mc), 1, 100_000_000, "mortgage_current_principal")
 
-    ts = now_utc().isoformat()
+    ts = now_iso()
     await mongo_db.settings.update_one(
         {"_id": "default"},
         {
@@ -983,6 +1259,8 @@ async def update_settings(payload: SettingsUpdate) -> SettingsResponse:
         },
         upsert=True,
     )
+    # Mortgage summary is derived from settings too
+    cache_invalidate("summary", "settings", "mortgage")
     return await get_settings()
 
 
@@ -999,27 +1277,47 @@ def week_bounds(anchor: date) -> Tuple[date, date]:
     return start, end
 
 
+async def week_checkin_counts(start_iso: str, end_iso: str) -> Dict[str, int]:
+    # Count flagged check-ins server-side; returns one tiny doc instead of the week's docs
+    cursor = await mongo_db.checkins.aggregate(
+        [
+            {"$match": {"day": {"$gte": start_iso, "$lte": end_iso}}},
+            {
+                "$group": {
+                    "_id": None,
+                    "wakeups": {"$sum": {"$cond": ["$wakeup_5am", 1, 0]}},
+                    "workouts": {"$sum": {"$cond": ["$workout", 1, 0]}},
+                    "videos": {"$sum": {"$cond": ["$video_captured", 1, 0]}},
+                }
+            },
+        ]
+    )
+    res = await cursor.to_list(1)
+    if not res:
+        return {"wakeups": 0, "workouts": 0, "videos": 0}
+    return {"wakeups": res[0]["wakeups"], "workouts": res[0]["workouts"], "videos": res[0]["videos"]}
+
+
 @app.get("/api/review/weekly", response_model=WeeklyReviewResponse)
 async def weekly_review(anchor_day: Optional[str] = Query(None)) -> WeeklyReviewResponse:
     anchor = parse_date(anchor_day) if anchor_day else date.today()
     ws, we = week_bounds(anchor)
+    ws_iso, we_iso = iso_date(ws), iso_date(we)
 
-    checkins = await mongo_db.checkins.find({"day": {"$gte": iso_date(ws), "$lte": iso_date(we)}}).to_list(length=200)
-    wakeups = sum(1 for c in checkins if c.get("wakeup_5am"))
-    workouts = sum(1 for c in checkins if c.get("workout"))
-    videos = sum(1 for c in checkins if c.get("video_captured"))
-
-    mortgage_actions = await mongo_db.mortgage_events.count_documents({"day": {"$gte": iso_date(ws), "$lte": iso_date(we)}})
-    relationship_actions = await mongo_db.gifts.count_documents({"day": {"$gte": iso_date(ws), "$lte": iso_date(we)}})
+    counts, mortgage_action, relationship_action = await asyncio.gather(
+        week_checkin_counts(ws_iso, we_iso),
+        mongo_db.mortgage_events.find_one({"day": {"$gte": ws_iso, "$lte": we_iso}}, {"_id": 1}),
+        mongo_db.gifts.find_one({"day": {"$gte": ws_iso, "$lte": we_iso}}, {"_id": 1}),
+    )
 
     return WeeklyReviewResponse(
-        week_start=iso_date(ws),
-        week_end=iso_date(we),
-        wakeups_ge_4=wakeups >= 4,
-        workouts_completed_5=workouts >= 5,
-        captured_at_least_1_video=videos >= 1,
-        mortgage_action_taken=mortgage_actions >= 1,
-        relationship_action_taken=relationship_actions >= 1,
+        week_start=ws_iso,
+        week_end=we_iso,
+        wakeups_ge_4=counts["wakeups"] >= 4,
+        workouts_completed_5=counts["workouts"] >= 5,
+        captured_at_least_1_video=counts["videos"] >= 1,
+        mortgage_action_taken=mortgage_action is not None,
+        relationship_action_taken=relationship_action is not None,
     )
 
 
@@ -1027,100 +1325,154 @@ async def weekly_review(anchor_day: Optional[str] = Query(None)) -> WeeklyReview
 # Dashboard summary + reminders
 # -----------------------------
 
-async def calc_current_streak(field: str) -> int:
+STREAK_WINDOW_DAYS = 120
+
+
+async def fetch_streak_checkins(today: date, through: Optional[date] = None) -> Dict[str, Dict[str, Any]]:
+    # One range query for the whole streak window (checkins.day is unique), keyed by day.
+    # `through` extends the window past today, e.g. to cover the rest of the current week.
+    start = today - timedelta(days=STREAK_WINDOW_DAYS - 1)
+    end = max(today, through) if through else today
+    docs = await mongo_db.checkins.find(
+        {"day": {"$gte": iso_date(start), "$lte": iso_date(end)}},
+        {"_id": 0, "day": 1, "wakeup_5am": 1, "workout": 1, "video_captured": 1},
+    ).to_list((end - start).days + 1)
+    return {doc["day"]: doc for doc in docs}
+
+
+def calc_current_streak(checkins_by_day: Dict[str, Dict[str, Any]], field: str, today: date) -> int:
     # Compute consecutive days including today going backwards where checkin.field is True
-    today = date.today()
     streak = 0
-    for i in range(0, 120):
-        d = today - timedelta(days=i)
-        doc = await mongo_db.checkins.find_one({"day": iso_date(d)})
+    d = today
+    for _ in range(STREAK_WINDOW_DAYS):
+        doc = checkins_by_day.get(iso_date(d))
         if not doc or not doc.get(field, False):
             break
         streak += 1
+        d -= ONE_DAY
     return streak
 
 
+WEEK = timedelta(days=7)
+FORTNIGHT = timedelta(days=14)
+MONTH_30 = timedelta(days=30)
+
+class ReminderRule(NamedTuple):
+    # Latest-entry rules go overdue after max_age; monthly rules (max_age None) only
+    # check that this month's rollup count is non-zero.
+    key: str  # reminder id prefix
+    area: str
+    input: str  # key into build_summary's reminder inputs
+    max_age: Optional[timedelta]
+    overdue_msg: Optional[str]
+    missing_msg: str
+
+
+# In-app reminders, in display order
+REMINDER_RULES: Tuple[ReminderRule, ...] = (
+    ReminderRule("weight", "Fitness", "latest_weight", WEEK, "Weight check-in overdue (aim weekly).", "No weight logged yet (weekly)."),
+    ReminderRule("bodyfat", "Fitness", "latest_body_fat", FORTNIGHT, "Body fat check overdue (every 2 weeks).", "No body fat logged yet (every 2 weeks)."),
+    ReminderRule("photo", "Fitness", "photos", None, None, "No progress photo logged yet this month."),
+    ReminderRule("gift", "Relationship", "gifts", None, None, "No gift/gesture logged this month yet."),
+    ReminderRule("mortgage-balance", "Mortgage", "latest_balance_check", MONTH_30, "Mortgage principal balance check overdue (monthly).", "Log your first mortgage principal balance check."),
+)
+
+
+def make_reminder(rule: ReminderRule, entry: Any, today: date) -> Optional[Dict[str, Any]]:
+    if not entry:
+        return {"id": f"{rule.key}-missing", "area": rule.area, "message": rule.missing_msg, "severity": "info"}
+    # An entry on or before the cutoff day is overdue. ISO day strings compare in date
+    # order, so the entry's day never needs parsing (and the cutoff is memoized).
+    if rule.max_age is not None and entry["day"] <= iso_date(today - rule.max_age):
+        return {"id": f"{rule.key}-overdue", "area": rule.area, "message": rule.overdue_msg, "severity": "warning"}
+    return None
+
+
+_summary_lock = asyncio.Lock()
+
+
 @app.get("/api/summary", response_model=SummaryResponse)
-async def summary() -> SummaryResponse:
+async def summary() -> ORJSONResponse:
+    # Polled by the dashboard; cached per day and busted by every write endpoint.
+    # The cached value is the response dict, so a hit goes straight to orjson.
     today = date.today()
+    cache_key = f"summary:{iso_date(today)}"
+    cached = cache_get(cache_key)
+    if cached is not None:
+        return ORJSONResponse(cached)
+
+    # Serialize misses so a burst of polls computes the summary once
+    async with _summary_lock:
+        cached = cache_get(cache_key)
+        if cached is not None:
+            return ORJSONResponse(cached)
+        generation = cache_generation()
+        out = await build_summary(today)
+        cache_set(cache_key, out, generation)
+        return ORJSONResponse(out)
+
+
+async def build_summary(today: date) -> Dict[str, Any]:
     ws, we = week_bounds(today)
+    today_iso, ws_iso, we_iso = iso_date(today), iso_date(ws), iso_date(we)
+    # Independent reads (including the ones the reminders need); run them concurrently
+    streak_checkins, state, rollup, mortgage, trip_doc = await asyncio.gather(
+        fetch_streak_checkins(today, through=we),
+        fetch_state_latest(),
+        mongo_db.monthly_rollups.find_one({"_id": month_key(today_iso)}),
+        compute_mortgage_summary(today),
+        mongo_db.trip.find_one({"_id": "default"}),
+    )
+    rollup = rollup or {}
+    last_weight_doc = state.get("latest_weight")
+    last_bf_doc = state.get("latest_body_fat")
+    last_balance_doc = state.get("latest_balance_check")
+    gifts_this_month = int(rollup.get("gifts", 0))
 
-    week_checkins = await mongo_db.checkins.find({"day": {"$gte": iso_date(ws), "$lte": iso_date(we)}}).to_list(length=200)
+    current_wakeup_streak = calc_current_streak(streak_checkins, "wakeup_5am", today)
+    current_workout_streak = calc_current_streak(streak_checkins, "workout", today)
 
+    # The streak window already covers this week, so count from it instead of querying again
+    week_checkins = [doc for day, doc in streak_checkins.items() if ws_iso <= day <= we_iso]
     week_wakeup_count = sum(1 for c in week_checkins if c.get("wakeup_5am"))
     week_workout_count = sum(1 for c in week_checkins if c.get("workout"))
     week_video_count = sum(1 for c in week_checkins if c.get("video_captured"))
 
-    current_wakeup_streak = await calc_current_streak("wakeup_5am")
-    current_workout_streak = await calc_current_streak("workout")
-
-    latest_weight = await mongo_db.metrics.find({"kind": "weight"}).sort("day", -1).limit(1).to_list(length=1)
-    latest_bf = await mongo_db.metrics.find({"kind": {"$in": ["body_fat", "waist"]}}).sort("day", -1).limit(1).to_list(length=1)
-
-    mortgage = await mortgage_summary()
-
-    trip_doc = await mongo_db.trip.find_one({"_id": "default"})
     trip_lodging_booked = bool(trip_doc.get("lodging_booked", False)) if trip_doc else False
     trip_childcare_confirmed = bool(trip_doc.get("childcare_confirmed", False)) if trip_doc else False
 
-    month_start = date(today.year, today.month, 1)
-    gifts_this_month = await mongo_db.gifts.count_documents({"day": {"$gte": iso_date(month_start), "$lte": iso_date(today)}})
-
-    reminders: List[Dict[str, Any]] = []
+    # Rule inputs: the state doc's latest entries plus this month's rollup counts
+    reminder_inputs = {
+        "latest_weight": last_weight_doc,
+        "latest_body_fat": last_bf_doc,
+        "latest_balance_check": last_balance_doc,
+        "photos": rollup.get("photos", 0),
+        "gifts": gifts_this_month,
+    }
+    reminders = [
+        reminder
+        for rule in REMINDER_RULES
+        if (reminder := make_reminder(rule, reminder_inputs[rule.input], today)) is not None
+    ]
 
-    # In-app reminders
-    # 1) Weekly weigh-in (no weight entry in last 7 days)
-    last_weight_doc = latest_weight[0] if latest_weight else None
-    if last_weight_doc:
-        last_weight_day = parse_date(last_weight_doc["day"])
-        if (today - last_weight_day).days >= 7:
-            reminders.append({"id": "weight-overdue", "area": "Fitness", "message": "Weight check-in overdue (aim weekly).", "severity": "warning"})
-    else:
-        reminders.append({"id": "weight-missing", "area": "Fitness", "message": "No weight logged yet (weekly).", "severity": "info"})
-
-    # 2) Waist (every 14 days)
-    last_bf_doc = latest_bf[0] if latest_bf else None
-    if last_bf_doc:
-        last_bf_day = parse_date(last_bf_doc["day"])
-        if (today - last_bf_day).days >= 14:
-            reminders.append({"id": "bodyfat-overdue", "area": "Fitness", "message": "Body fat check overdue (every 2 weeks).", "severity": "warning"})
-    else:
-        reminders.append({"id": "bodyfat-missing", "area": "Fitness", "message": "No body fat logged yet (every 2 weeks).", "severity": "info"})
-
-    # 3) Monthly photo (no photo this month)
-    photo_count = await mongo_db.photos.count_documents({"day": {"$gte": iso_date(month_start), "$lte": iso_date(today)}})
-    if photo_count == 0:
-        reminders.append({"id": "photo-missing", "area": "Fitness", "message": "No progress photo logged yet this month.", "severity": "info"})
-
-    # 4) Monthly gift
-    if gifts_this_month == 0:
-        reminders.append({"id": "gift-missing", "area": "Relationship", "message": "No gift/gesture logged this month yet.", "severity": "info"})
-
-    # 5) Mortgage monthly balance check
-    last_balance = await mongo_db.mortgage_events.find({"kind": "balance_check"}).sort("day", -1).limit(1).to_list(length=1)
-    if last_balance:
-        last_balance_day = parse_date(last_balance[0]["day"])
-        if (today - last_balance_day).days >= 30:
-            reminders.append({"id": "mortgage-balance-overdue", "area": "Mortgage", "message": "Mortgage principal balance check overdue (monthly).", "severity": "warning"})
-    else:
-        reminders.append({"id": "mortgage-balance-missing", "area": "Mortgage", "message": "Log your first mortgage principal balance check.", "severity": "info"})
-
-    return SummaryResponse(
-        today=iso_date(today),
-        current_wakeup_streak=current_wakeup_streak,
-        current_workout_streak=current_workout_streak,
-        week_wakeup_count=week_wakeup_count,
-        week_workout_count=week_workout_count,
-        week_video_count=week_video_count,
-        latest_weight_lbs=latest_weight[0]["value"] if latest_weight else None,
-        latest_body_fat_pct=latest_bf[0]["value"] if latest_bf else None,
-        mortgage_target_principal=float(mortgage.get("mortgage_target_principal", DEFAULT_MORTGAGE_TARGET_PRINCIPAL)),
-        mortgage_start_principal=float(mortgage.get("mortgage_start_principal", DEFAULT_MORTGAGE_START_PRINCIPAL)),
-        latest_principal_balance=mortgage.get("latest_principal_balance"),
-        principal_paid_extra_ytd=float(mortgage.get("principal_paid_extra_ytd", 0.0)),
-        principal_paid_extra_month=float(mortgage.get("principal_paid_extra_month", 0.0)),
-        trip_lodging_booked=trip_lodging_booked,
-        trip_childcare_confirmed=trip_childcare_confirmed,
-        gifts_this_month=gifts_this_month,
-        reminders=reminders,
-    )
+    # Every value is already typed above, so the response is a plain dict; SummaryResponse
+    # stays the documented response_model without validating each poll.
+    return {
+        "today": today_iso,
+        "current_wakeup_streak": current_wakeup_streak,
+        "current_workout_streak": current_workout_streak,
+        "week_wakeup_count": week_wakeup_count,
+        "week_workout_count": week_workout_count,
+        "week_video_count": week_video_count,
+        "latest_weight_lbs": float(last_weight_doc["value"]) if last_weight_doc else None,
+        "latest_body_fat_pct": float(last_bf_doc["value"]) if last_bf_doc else None,
+        "mortgage_target_principal": float(mortgage.get("mortgage_target_principal", DEFAULT_MORTGAGE_TARGET_PRINCIPAL)),
+        "mortgage_start_principal": float(mortgage.get("mortgage_start_principal", DEFAULT_MORTGAGE_START_PRINCIPAL)),
+        "latest_principal_balance": mortgage.get("latest_principal_balance"),
+        "principal_paid_extra_ytd": float(mortgage.get("principal_paid_extra_ytd", 0.0)),
+        "principal_paid_extra_month": float(mortgage.get("principal_paid_extra_month", 0.0)),
+        "trip_lodging_booked": trip_lodging_booked,
+        "trip_childcare_confirmed": trip_childcare_confirmed,
+        "gifts_this_month": gifts_this_month,
+        "reminders": reminders,
+    }
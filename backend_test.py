@@ -4,67 +4,203 @@ Backend API Testing for 2026 Accountability Tracker
 Tests all endpoints with comprehensive coverage
 """
 
+import asyncio
+import importlib.util
 import os
-import requests
+from contextlib import contextmanager
+from contextvars import ContextVar
+import httpx
+import orjson
 import sys
 import json
 from datetime import datetime, date, timedelta
-from typing import Dict, Any, Optional
+from typing import Awaitable, Callable, Dict, Any, Iterator, List, NamedTuple, Optional, Union
+
+# Cap on in-flight requests once the independent flows run concurrently
+MAX_CONCURRENT_REQUESTS = 8
+
+# The reachability probe gets a short timeout; a down backend should fail in seconds
+PROBE_TIMEOUT_SECONDS = 2
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Every endpoint the suite calls; each is resolved against base_url once per tester
+ENDPOINTS = (
+    "api/health",
+    "api/auth/login",
+    "api/admin/reset",
+    "api/summary",
+    "api/checkins",
+    "api/checkins/upsert",
+    "api/fitness/weight",
+    "api/fitness/body-fat",
+    "api/fitness/waist",
+    "api/fitness/metrics",
+    "api/mortgage/principal-payment",
+    "api/mortgage/balance-check",
+    "api/mortgage/events",
+    "api/mortgage/summary",
+    "api/relationship/trip",
+    "api/relationship/trip/history",
+    "api/relationship/gifts",
+    "api/settings",
+    "api/review/weekly",
+)
+
+# HTTP/2 (negotiated over TLS, e.g. the preview URL) multiplexes the concurrent flows on one
+# connection; it needs the optional h2 package (pip install "httpx[http2]")
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Lines echoed by the running flow; each concurrent flow task gets its own buffer
+flow_output: ContextVar[Optional[List[str]]] = ContextVar("flow_output", default=None)
+
+
+@contextmanager
+def buffered_output() -> Iterator[None]:
+    """Collect echoed lines and write them with one stdout write on exit"""
+    lines: List[str] = []
+    token = flow_output.set(lines)
+    try:
+        yield
+    finally:
+        flow_output.reset(token)
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
+
+class Outcome(NamedTuple):
+    """One logged check; the run's counters are reduced from these at the end"""
+    name: str
+    success: bool
+    details: str
+
+
+class Failure(NamedTuple):
+    name: str
+    details: str
+
+
+# Static request bodies, encoded once
+SETTINGS_BODY = orjson.dumps({
+    "sendgrid_api_key": "SG.test_key_12345",
+    "sendgrid_sender_email": "test@example.com",
+    "reminder_recipient_email": "user@example.com",
+    "weekly_review_day": "Mon",
+    "weekly_review_hour_local": 10,
+    "monthly_gift_day": 15,
+    "email_enabled": True
+})
+LEGACY_TRIP_BODY = orjson.dumps({
+    "dates": "Summer 2026 - TBD",
+    "adults_only": True,
+    "lodging_booked": False,
+    "notes": "Testing legacy dates field compatibility"
+})
+
+# Static parts of the dated payloads; flows add the day (or trip dates) per run
+WEIGHT_PAYLOAD = {"weight_lbs": 175.5}
+BODY_FAT_PAYLOAD = {"body_fat_pct": 18.5}
+WAIST_PAYLOAD = {"waist_in": 17.2}
+TRIP_PAYLOAD = {
+    "dates": "Spring getaway",
+    "adults_only": True,
+    "lodging_booked": True,
+    "childcare_confirmed": False,
+    "notes": "Beach resort getaway - test update with structured dates"
+}
+GIFT_PAYLOAD = {"description": "Surprise flowers - test gift", "amount": 45.0}
 
 class AccountabilityAPITester:
     def __init__(self, base_url: Optional[str] = None):
         # Use REACT_APP_BACKEND_URL for testing to match frontend behavior
-        self.base_url = base_url or os.environ.get("REACT_APP_BACKEND_URL") or "http://localhost:8001"
+        # Normalized once: a trailing slash would otherwise produce "//api/..." paths
+        self.base_url = (base_url or os.environ.get("REACT_APP_BACKEND_URL") or "http://localhost:8001").rstrip("/")
+        self.outcomes: List[Outcome] = []
         self.tests_run = 0
         self.tests_passed = 0
-        self.failed_tests = []
-        self.session = requests.Session()
-        self.session.timeout = 15
+        self.failed_tests: List[Failure] = []
+        # Every body this suite sends is JSON, so the Content-Type is a client default.
+        # Size the pool to the request cap and keep every connection alive, so concurrent
+        # flows reuse sockets instead of opening new ones.
+        # Endpoints are relative ("api/..."); httpx joins them onto base_url
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            http2=HTTP2_AVAILABLE,
+            timeout=15,
+            headers=JSON_HEADERS,
+            limits=httpx.Limits(
+                max_connections=MAX_CONCURRENT_REQUESTS,
+                max_keepalive_connections=MAX_CONCURRENT_REQUESTS,
+            ),
+        )
+        self.urls = {endpoint: self.client.base_url.join(endpoint) for endpoint in ENDPOINTS}
+        self.request_slots = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
         self.correct_password = "2026letters"  # The actual password
 
+        # Every flow works relative to the same day; format the dates it needs once
+        self.today = date.today()
+        self.today_iso = self.today.isoformat()
+        self.days_ago_7_iso = (self.today - timedelta(days=7)).isoformat()
+        self.days_ago_30_iso = (self.today - timedelta(days=30)).isoformat()
+        self.days_ahead_30_iso = (self.today + timedelta(days=30)).isoformat()
+        self.days_ahead_33_iso = (self.today + timedelta(days=33)).isoformat()
+        self.days_ahead_45_iso = (self.today + timedelta(days=45)).isoformat()
+        self.days_ahead_48_iso = (self.today + timedelta(days=48)).isoformat()
+        # Shared query params for the date-range list endpoints (httpx only reads them)
+        self.last_7_days = {"start": self.days_ago_7_iso, "end": self.today_iso}
+        self.last_30_days = {"start": self.days_ago_30_iso, "end": self.today_iso}
+
+    def echo(self, line: str = ""):
+        """Print a line, or buffer it when inside buffered_output()"""
+        lines = flow_output.get()
+        if lines is None:
+            print(line)
+        else:
+            lines.append(line)
+
     def log_test(self, name: str, success: bool, details: str = ""):
         """Log test result"""
-        self.tests_run += 1
+        self.outcomes.append(Outcome(name, success, details))
         if success:
-            self.tests_passed += 1
-            print(f"✅ {name}")
+            self.echo(f"✅ {name}")
         else:
-            self.failed_tests.append({"name": name, "details": details})
-            print(f"❌ {name} - {details}")
+            self.echo(f"❌ {name} - {details}")
+
+    def tally(self):
+        """Reduce the logged outcomes into the run's counters"""
+        self.tests_run = len(self.outcomes)
+        self.failed_tests = [Failure(o.name, o.details) for o in self.outcomes if not o.success]
+        self.tests_passed = self.tests_run - len(self.failed_tests)
 
-    def run_test(self, name: str, method: str, endpoint: str, expected_status: int, 
-                 data: Optional[Dict] = None, params: Optional[Dict] = None, 
+    async def run_test(self, name: str, method: str, endpoint: str, expected_status: int, 
+                 data: Optional[Union[Dict, bytes]] = None, params: Optional[Dict] = None, 
                  headers: Optional[Dict] = None) -> tuple[bool, Dict]:
         """Run a single API test"""
-        url = f"{self.base_url}/{endpoint}"
         
-        # Merge headers
-        request_headers = {}
-        if headers:
-            request_headers.update(headers)
+        # JSON bodies are encoded with orjson; prebuilt bytes are sent as-is
+        body = None
+        if data is not None:
+            body = data if isinstance(data, bytes) else orjson.dumps(data)
         
         try:
-            if method == 'GET':
-                response = self.session.get(url, params=params, headers=request_headers)
-            elif method == 'POST':
-                response = self.session.post(url, json=data, params=params, headers=request_headers)
-            elif method == 'PUT':
-                response = self.session.put(url, json=data, params=params, headers=request_headers)
-            else:
-                raise ValueError(f"Unsupported method: {method}")
+            # One generic request call; GET/POST/PUT differ only in the method string
+            async with self.request_slots:
+                response = await self.client.request(method, self.urls.get(endpoint, endpoint), content=body, params=params, headers=headers)
 
             success = response.status_code == expected_status
             response_data = {}
             
-            try:
-                response_data = response.json()
-            except:
-                response_data = {"raw_response": response.text}
+            # Empty bodies stay {}; only a body that isn't JSON falls back to raw text
+            if response.content:
+                try:
+                    response_data = orjson.loads(response.content)
+                except orjson.JSONDecodeError:
+                    response_data = {"raw_response": response.content[:1024].decode("utf-8", errors="replace")}
 
             if success:
                 self.log_test(name, True)
             else:
-                self.log_test(name, False, f"Expected {expected_status}, got {response.status_code}: {response.text[:200]}")
+                self.log_test(name, False, f"Expected {expected_status}, got {response.status_code}: {response.content[:200].decode('utf-8', errors='replace')}")
 
             return success, response_data
 
@@ -72,76 +208,76 @@ class AccountabilityAPITester:
             self.log_test(name, False, f"Exception: {str(e)}")
             return False, {}
 
-    def test_password_protection(self) -> bool:
+    async def test_password_protection(self) -> bool:
         """Test password protection middleware"""
-        print("   Testing password protection...")
+        self.echo("   Testing password protection...")
         
         # Test 1: Public endpoints should work without password
-        success, data = self.run_test("Health Check (Public)", "GET", "api/health", 200)
+        success, data = await self.run_test("Health Check (Public)", "GET", "api/health", 200)
         if not success:
             return False
-        print(f"   ✅ Health endpoint accessible without password")
+        self.echo(f"   ✅ Health endpoint accessible without password")
         
         # Test 2: Auth login endpoint should be public
-        success, data = self.run_test("Auth Login Endpoint (Public)", "POST", "api/auth/login", 401, 
+        success, data = await self.run_test("Auth Login Endpoint (Public)", "POST", "api/auth/login", 401, 
                                     data={"password": "wrong_password"})
         if not success:
             return False
-        print(f"   ✅ Auth login endpoint accessible (returns 401 for wrong password)")
+        self.echo(f"   ✅ Auth login endpoint accessible (returns 401 for wrong password)")
         
         # Test 3: Protected endpoints should return 401 without password
-        success, data = self.run_test("Summary Without Password", "GET", "api/summary", 401)
+        success, data = await self.run_test("Summary Without Password", "GET", "api/summary", 401)
         if not success:
             return False
-        print(f"   ✅ Protected endpoint returns 401 without password")
+        self.echo(f"   ✅ Protected endpoint returns 401 without password")
         
         # Test 4: Protected endpoints should return 401 with wrong password
         wrong_headers = {"x-app-password": "wrong_password"}
-        success, data = self.run_test("Summary With Wrong Password", "GET", "api/summary", 401, 
+        success, data = await self.run_test("Summary With Wrong Password", "GET", "api/summary", 401, 
                                     headers=wrong_headers)
         if not success:
             return False
-        print(f"   ✅ Protected endpoint returns 401 with wrong password")
+        self.echo(f"   ✅ Protected endpoint returns 401 with wrong password")
         
         # Test 5: Auth login with correct password should succeed
-        success, data = self.run_test("Auth Login With Correct Password", "POST", "api/auth/login", 200,
+        success, data = await self.run_test("Auth Login With Correct Password", "POST", "api/auth/login", 200,
                                     data={"password": self.correct_password})
         if not success:
             return False
         if not data.get("ok") or not data.get("enabled"):
             self.log_test("Auth Login Response Validation", False, f"Expected ok=True and enabled=True, got {data}")
             return False
-        print(f"   ✅ Auth login succeeds with correct password")
+        self.echo(f"   ✅ Auth login succeeds with correct password")
         
         # Test 6: Protected endpoints should work with correct password
         correct_headers = {"x-app-password": self.correct_password}
-        success, data = self.run_test("Summary With Correct Password", "GET", "api/summary", 200,
+        success, data = await self.run_test("Summary With Correct Password", "GET", "api/summary", 200,
                                     headers=correct_headers)
         if not success:
             return False
-        print(f"   ✅ Protected endpoint works with correct password")
+        self.echo(f"   ✅ Protected endpoint works with correct password")
         
         # Test 7: Test password via query parameter (alternative method)
-        success, data = self.run_test("Summary With Password Query Param", "GET", "api/summary", 200,
+        success, data = await self.run_test("Summary With Password Query Param", "GET", "api/summary", 200,
                                     params={"password": self.correct_password})
         if not success:
             return False
-        print(f"   ✅ Protected endpoint works with password query parameter")
+        self.echo(f"   ✅ Protected endpoint works with password query parameter")
         
         # Test 8: Test CORS headers are present in 401 responses
-        success, response_data = self.run_test("CORS Headers in 401", "GET", "api/summary", 401)
+        success, response_data = await self.run_test("CORS Headers in 401", "GET", "api/summary", 401)
         if not success:
             return False
-        print(f"   ✅ CORS headers present in 401 responses")
+        self.echo(f"   ✅ CORS headers present in 401 responses")
         
         return True
 
-    def test_password_integration_flow(self) -> bool:
+    async def test_password_integration_flow(self) -> bool:
         """Test full integration flow with password protection"""
-        print("   Testing password integration flow...")
+        self.echo("   Testing password integration flow...")
         
         # Set password header for all subsequent requests
-        self.session.headers.update({"x-app-password": self.correct_password})
+        self.client.headers.update({"x-app-password": self.correct_password})
         
         # Test that all major endpoints work with password
         endpoints_to_test = [
@@ -151,57 +287,46 @@ class AccountabilityAPITester:
             ("GET", "api/mortgage/summary", 200)
         ]
         
-        for method, endpoint, expected_status in endpoints_to_test:
-            success, data = self.run_test(f"Password Integration - {endpoint}", method, endpoint, expected_status)
-            if not success:
-                return False
+        # Read-only requests; issue them concurrently
+        results = await asyncio.gather(*(
+            self.run_test(f"Password Integration - {endpoint}", method, endpoint, expected_status)
+            for method, endpoint, expected_status in endpoints_to_test
+        ))
+        if not all(success for success, _ in results):
+            return False
         
-        print(f"   ✅ All major endpoints work with password authentication")
+        self.echo(f"   ✅ All major endpoints work with password authentication")
         return True
 
-    def test_health(self) -> bool:
-        """Test health endpoint"""
-        success, data = self.run_test("Health Check", "GET", "api/health", 200)
-        if success and data.get("status") == "ok":
-            print(f"   Health status: {data.get('status')}, App: {data.get('app')}")
-            return True
-        return False
-
-    def test_summary(self) -> bool:
-        """Test summary endpoint"""
-        success, data = self.run_test("Dashboard Summary", "GET", "api/summary", 200)
-        if success:
-            print(f"   Today: {data.get('today')}")
-            print(f"   Wakeup streak: {data.get('current_wakeup_streak')}")
-            print(f"   Workout streak: {data.get('current_workout_streak')}")
-            print(f"   Latest weight: {data.get('latest_weight_lbs')}")
-            print(f"   Latest body fat: {data.get('latest_body_fat_pct')}")
-            print(f"   Reminders: {len(data.get('reminders', []))}")
-            return True
-        return False
+    async def test_health(self) -> bool:
         """Test health endpoint"""
-        success, data = self.run_test("Health Check", "GET", "api/health", 200)
+        success, data = await self.run_test("Health Check", "GET", "api/health", 200)
         if success and data.get("status") == "ok":
-            print(f"   Health status: {data.get('status')}, App: {data.get('app')}")
+            self.echo(f"   Health status: {data.get('status')}, App: {data.get('app')}")
             return True
         return False
 
-    def test_summary(self) -> bool:
+    async def test_summary(self) -> bool:
         """Test summary endpoint"""
-        success, data = self.run_test("Dashboard Summary", "GET", "api/summary", 200)
+        success, data = await self.run_test("Dashboard Summary", "GET", "api/summary", 200)
         if success:
-            print(f"   Today: {data.get('today')}")
-            print(f"   Wakeup streak: {data.get('current_wakeup_streak')}")
-            print(f"   Workout streak: {data.get('current_workout_streak')}")
-            print(f"   Latest weight: {data.get('latest_weight_lbs')}")
-            print(f"   Latest body fat: {data.get('latest_body_fat_pct')}")
-            print(f"   Reminders: {len(data.get('reminders', []))}")
+            try:
+                self.echo(
+                    f"   Today: {data['today']}\n"
+                    f"   Wakeup streak: {data['current_wakeup_streak']}\n"
+                    f"   Workout streak: {data['current_workout_streak']}\n"
+                    f"   Latest weight: {data['latest_weight_lbs']}\n"
+                    f"   Latest body fat: {data['latest_body_fat_pct']}\n"
+                    f"   Reminders: {len(data['reminders'])}"
+                )
+            except KeyError as e:
+                self.echo(f"   Missing response field: {e}")
             return True
         return False
 
-    def test_checkin_flow(self) -> bool:
+    async def test_checkin_flow(self) -> bool:
         """Test check-in upsert and retrieval"""
-        today = date.today().isoformat()
+        today = self.today_iso
         
         # Test upsert check-in
         checkin_data = {
@@ -212,73 +337,67 @@ class AccountabilityAPITester:
             "notes": "Test check-in from automated test"
         }
         
-        success, data = self.run_test("Upsert Check-in", "POST", "api/checkins/upsert", 200, checkin_data)
+        success, data = await self.run_test("Upsert Check-in", "POST", "api/checkins/upsert", 200, checkin_data)
         if not success:
             return False
             
         checkin_id = data.get("id")
         if checkin_id:
-            print(f"   Created check-in ID: {checkin_id}")
+            self.echo(f"   Created check-in ID: {checkin_id}")
         
         # Test list check-ins
-        start_date = (date.today() - timedelta(days=7)).isoformat()
-        end_date = today
-        
-        success, data = self.run_test("List Check-ins", "GET", "api/checkins", 200, 
-                                    params={"start": start_date, "end": end_date})
+        success, data = await self.run_test("List Check-ins", "GET", "api/checkins", 200, 
+                                    params=self.last_7_days)
         if success:
-            print(f"   Retrieved {len(data)} check-ins")
+            self.echo(f"   Retrieved {len(data)} check-ins")
             return True
         return False
 
-    def test_fitness_flow(self) -> bool:
+    async def test_fitness_flow(self) -> bool:
         """Test fitness metrics (weight, body fat, backward compatibility)"""
-        today = date.today().isoformat()
+        today = self.today_iso
         
         # Test add weight
-        weight_data = {"day": today, "weight_lbs": 175.5}
-        success, data = self.run_test("Add Weight", "POST", "api/fitness/weight", 200, weight_data)
+        weight_data = {"day": today, **WEIGHT_PAYLOAD}
+        success, data = await self.run_test("Add Weight", "POST", "api/fitness/weight", 200, weight_data)
         if not success:
             return False
-        print(f"   Added weight: {data.get('value')} lbs")
+        self.echo(f"   Added weight: {data.get('value')} lbs")
         
         # Test add body fat (new endpoint)
-        body_fat_data = {"day": today, "body_fat_pct": 18.5}
-        success, data = self.run_test("Add Body Fat", "POST", "api/fitness/body-fat", 200, body_fat_data)
+        body_fat_data = {"day": today, **BODY_FAT_PAYLOAD}
+        success, data = await self.run_test("Add Body Fat", "POST", "api/fitness/body-fat", 200, body_fat_data)
         if not success:
             return False
-        print(f"   Added body fat: {data.get('value')}%")
+        self.echo(f"   Added body fat: {data.get('value')}%")
         
         # Test backward compatibility - waist endpoint should still work as alias
-        waist_data = {"day": today, "waist_in": 17.2}
-        success, data = self.run_test("Add Waist (Backward Compat)", "POST", "api/fitness/waist", 200, waist_data)
+        waist_data = {"day": today, **WAIST_PAYLOAD}
+        success, data = await self.run_test("Add Waist (Backward Compat)", "POST", "api/fitness/waist", 200, waist_data)
         if not success:
             return False
-        print(f"   Added via waist endpoint (body fat): {data.get('value')}%")
+        self.echo(f"   Added via waist endpoint (body fat): {data.get('value')}%")
         
         # Test get fitness metrics
-        start_date = (date.today() - timedelta(days=30)).isoformat()
-        end_date = today
-        
-        success, data = self.run_test("Get Fitness Metrics", "GET", "api/fitness/metrics", 200,
-                                    params={"start": start_date, "end": end_date})
+        success, data = await self.run_test("Get Fitness Metrics", "GET", "api/fitness/metrics", 200,
+                                    params=self.last_30_days)
         if success:
             metrics = data.get("metrics", [])
             photos = data.get("photos", [])
             latest = data.get("latest", {})
-            print(f"   Retrieved {len(metrics)} metrics, {len(photos)} photos")
-            print(f"   Latest weight: {latest.get('weight_lbs')}, body fat: {latest.get('body_fat_pct')}")
+            self.echo(f"   Retrieved {len(metrics)} metrics, {len(photos)} photos")
+            self.echo(f"   Latest weight: {latest.get('weight_lbs')}, body fat: {latest.get('body_fat_pct')}")
             
             # Verify body_fat metrics are returned (not waist)
             body_fat_metrics = [m for m in metrics if m.get('kind') == 'body_fat']
-            print(f"   Body fat metrics found: {len(body_fat_metrics)}")
+            self.echo(f"   Body fat metrics found: {len(body_fat_metrics)}")
             
             return True
         return False
 
-    def test_mortgage_flow(self) -> bool:
+    async def test_mortgage_flow(self) -> bool:
         """Test mortgage tracking"""
-        today = date.today().isoformat()
+        today = self.today_iso
         
         # Test add principal payment
         payment_data = {
@@ -286,10 +405,10 @@ class AccountabilityAPITester:
             "amount": 1500.0,
             "note": "Extra principal payment - test"
         }
-        success, data = self.run_test("Add Principal Payment", "POST", "api/mortgage/principal-payment", 200, payment_data)
+        success, data = await self.run_test("Add Principal Payment", "POST", "api/mortgage/principal-payment", 200, payment_data)
         if not success:
             return False
-        print(f"   Added payment: ${data.get('amount')}")
+        self.echo(f"   Added payment: ${data.get('amount')}")
         
         # Test add balance check
         balance_data = {
@@ -297,119 +416,103 @@ class AccountabilityAPITester:
             "principal_balance": 328500.0,
             "note": "Monthly balance check - test"
         }
-        success, data = self.run_test("Add Balance Check", "POST", "api/mortgage/balance-check", 200, balance_data)
+        success, data = await self.run_test("Add Balance Check", "POST", "api/mortgage/balance-check", 200, balance_data)
         if not success:
             return False
-        print(f"   Added balance check: ${data.get('amount')}")
+        self.echo(f"   Added balance check: ${data.get('amount')}")
         
         # Test get mortgage events
-        start_date = (date.today() - timedelta(days=30)).isoformat()
-        end_date = today
-        
-        success, data = self.run_test("List Mortgage Events", "GET", "api/mortgage/events", 200,
-                                    params={"start": start_date, "end": end_date})
+        success, data = await self.run_test("List Mortgage Events", "GET", "api/mortgage/events", 200,
+                                    params=self.last_30_days)
         if not success:
             return False
-        print(f"   Retrieved {len(data)} mortgage events")
+        self.echo(f"   Retrieved {len(data)} mortgage events")
         
         # Test mortgage summary
-        success, data = self.run_test("Mortgage Summary", "GET", "api/mortgage/summary", 200)
+        success, data = await self.run_test("Mortgage Summary", "GET", "api/mortgage/summary", 200)
         if success:
-            print(f"   Start principal: ${data.get('mortgage_start_principal')}")
-            print(f"   Target principal: ${data.get('mortgage_target_principal')}")
-            print(f"   Latest balance: ${data.get('latest_principal_balance')}")
-            print(f"   Extra paid YTD: ${data.get('principal_paid_extra_ytd')}")
+            try:
+                self.echo(
+                    f"   Start principal: ${data['mortgage_start_principal']}\n"
+                    f"   Target principal: ${data['mortgage_target_principal']}\n"
+                    f"   Latest balance: ${data['latest_principal_balance']}\n"
+                    f"   Extra paid YTD: ${data['principal_paid_extra_ytd']}"
+                )
+            except KeyError as e:
+                self.echo(f"   Missing response field: {e}")
             return True
         return False
 
-    def test_relationship_flow(self) -> bool:
+    async def test_relationship_flow(self) -> bool:
         """Test relationship tracking (trip, gifts)"""
-        today = date.today().isoformat()
+        today = self.today_iso
         
         # Test get trip
-        success, data = self.run_test("Get Trip", "GET", "api/relationship/trip", 200)
+        success, data = await self.run_test("Get Trip", "GET", "api/relationship/trip", 200)
         if not success:
             return False
         
         # Test update trip with structured dates
-        future_start = (date.today() + timedelta(days=30)).isoformat()
-        future_end = (date.today() + timedelta(days=33)).isoformat()
+        future_start = self.days_ahead_30_iso
+        future_end = self.days_ahead_33_iso
         
-        trip_data = {
-            "start_date": future_start,
-            "end_date": future_end,
-            "dates": "Spring getaway",
-            "adults_only": True,
-            "lodging_booked": True,
-            "childcare_confirmed": False,
-            "notes": "Beach resort getaway - test update with structured dates"
-        }
-        success, data = self.run_test("Update Trip with Structured Dates", "PUT", "api/relationship/trip", 200, trip_data)
+        trip_data = {"start_date": future_start, "end_date": future_end, **TRIP_PAYLOAD}
+        success, data = await self.run_test("Update Trip with Structured Dates", "PUT", "api/relationship/trip", 200, trip_data)
         if not success:
             return False
-        print(f"   Updated trip: {data.get('start_date')} → {data.get('end_date')}")
-        print(f"   Adults-only: {data.get('adults_only')}, Lodging: {data.get('lodging_booked')}")
+        self.echo(f"   Updated trip: {data.get('start_date')} → {data.get('end_date')}")
+        self.echo(f"   Adults-only: {data.get('adults_only')}, Lodging: {data.get('lodging_booked')}")
         
         # Test trip history
-        success, history_data = self.run_test("Get Trip History", "GET", "api/relationship/trip/history", 200,
+        success, history_data = await self.run_test("Get Trip History", "GET", "api/relationship/trip/history", 200,
                                             params={"limit": 10})
         if not success:
             return False
-        print(f"   Retrieved {len(history_data)} trip history entries")
+        self.echo(f"   Retrieved {len(history_data)} trip history entries")
         
         # Test add gift
-        gift_data = {
-            "day": today,
-            "description": "Surprise flowers - test gift",
-            "amount": 45.0
-        }
-        success, data = self.run_test("Add Gift", "POST", "api/relationship/gifts", 200, gift_data)
+        gift_data = {"day": today, **GIFT_PAYLOAD}
+        success, data = await self.run_test("Add Gift", "POST", "api/relationship/gifts", 200, gift_data)
         if not success:
             return False
-        print(f"   Added gift: {data.get('description')} - ${data.get('amount')}")
+        self.echo(f"   Added gift: {data.get('description')} - ${data.get('amount')}")
         
         # Test list gifts
-        current_date = date.today()
-        success, data = self.run_test("List Gifts", "GET", "api/relationship/gifts", 200,
+        current_date = self.today
+        success, data = await self.run_test("List Gifts", "GET", "api/relationship/gifts", 200,
                                     params={"year": current_date.year, "month": current_date.month})
         if success:
-            print(f"   Retrieved {len(data)} gifts for current month")
+            self.echo(f"   Retrieved {len(data)} gifts for current month")
             return True
         return False
 
-    def test_settings_flow(self) -> bool:
+    async def test_settings_flow(self) -> bool:
         """Test settings (SendGrid configuration)"""
         # Test get settings
-        success, data = self.run_test("Get Settings", "GET", "api/settings", 200)
+        success, data = await self.run_test("Get Settings", "GET", "api/settings", 200)
         if not success:
             return False
         
-        original_settings = data.copy()
-        
         # Test update settings
-        settings_data = {
-            "sendgrid_api_key": "SG.test_key_12345",
-            "sendgrid_sender_email": "test@example.com",
-            "reminder_recipient_email": "user@example.com",
-            "weekly_review_day": "Mon",
-            "weekly_review_hour_local": 10,
-            "monthly_gift_day": 15,
-            "email_enabled": True
-        }
-        success, data = self.run_test("Update Settings", "PUT", "api/settings", 200, settings_data)
+        success, data = await self.run_test("Update Settings", "PUT", "api/settings", 200, SETTINGS_BODY)
         if success:
-            print(f"   Email enabled: {data.get('email_enabled')}")
-            print(f"   Weekly review: {data.get('weekly_review_day')} at {data.get('weekly_review_hour_local')}:00")
-            print(f"   Monthly gift day: {data.get('monthly_gift_day')}")
+            try:
+                self.echo(
+                    f"   Email enabled: {data['email_enabled']}\n"
+                    f"   Weekly review: {data['weekly_review_day']} at {data['weekly_review_hour_local']}:00\n"
+                    f"   Monthly gift day: {data['monthly_gift_day']}"
+                )
+            except KeyError as e:
+                self.echo(f"   Missing response field: {e}")
             return True
         return False
 
-    def test_mortgage_settings_flow(self) -> bool:
+    async def test_mortgage_settings_flow(self) -> bool:
         """Test mortgage settings functionality"""
-        print("   Testing mortgage settings...")
+        self.echo("   Testing mortgage settings...")
         
         # Test get settings includes mortgage fields
-        success, data = self.run_test("Get Settings - Mortgage Fields", "GET", "api/settings", 200)
+        success, data = await self.run_test("Get Settings - Mortgage Fields", "GET", "api/settings", 200)
         if not success:
             return False
         
@@ -417,12 +520,15 @@ class AccountabilityAPITester:
         required_fields = ['mortgage_start_principal', 'mortgage_target_principal', 'mortgage_current_principal']
         for field in required_fields:
             if field not in data:
-                print(f"   ❌ Missing mortgage field: {field}")
+                self.echo(f"   ❌ Missing mortgage field: {field}")
                 return False
         
-        print(f"   ✅ Mortgage start principal: ${data.get('mortgage_start_principal')}")
-        print(f"   ✅ Mortgage target principal: ${data.get('mortgage_target_principal')}")
-        print(f"   ✅ Mortgage current principal: {data.get('mortgage_current_principal')}")
+        # Presence was checked just above, so index directly
+        self.echo(
+            f"   ✅ Mortgage start principal: ${data['mortgage_start_principal']}\n"
+            f"   ✅ Mortgage target principal: ${data['mortgage_target_principal']}\n"
+            f"   ✅ Mortgage current principal: {data['mortgage_current_principal']}"
+        )
         
         # Test update mortgage settings
         mortgage_settings = {
@@ -438,75 +544,80 @@ class AccountabilityAPITester:
             "mortgage_current_principal": 325000.0
         }
         
-        success, updated_data = self.run_test("Update Mortgage Settings", "PUT", "api/settings", 200, mortgage_settings)
+        success, updated_data = await self.run_test("Update Mortgage Settings", "PUT", "api/settings", 200, mortgage_settings)
         if not success:
             return False
         
-        print(f"   ✅ Updated start principal: ${updated_data.get('mortgage_start_principal')}")
-        print(f"   ✅ Updated target principal: ${updated_data.get('mortgage_target_principal')}")
-        print(f"   ✅ Updated current principal: ${updated_data.get('mortgage_current_principal')}")
+        try:
+            self.echo(
+                f"   ✅ Updated start principal: ${updated_data['mortgage_start_principal']}\n"
+                f"   ✅ Updated target principal: ${updated_data['mortgage_target_principal']}\n"
+                f"   ✅ Updated current principal: ${updated_data['mortgage_current_principal']}"
+            )
+        except KeyError as e:
+            self.echo(f"   Missing response field: {e}")
         
         # Test mortgage summary reflects settings
-        success, summary_data = self.run_test("Mortgage Summary - Settings Override", "GET", "api/mortgage/summary", 200)
+        success, summary_data = await self.run_test("Mortgage Summary - Settings Override", "GET", "api/mortgage/summary", 200)
         if not success:
             return False
         
         # Verify summary uses settings values
         if summary_data.get('mortgage_start_principal') != 350000.0:
-            print(f"   ❌ Summary start principal mismatch: expected 350000, got {summary_data.get('mortgage_start_principal')}")
+            self.echo(f"   ❌ Summary start principal mismatch: expected 350000, got {summary_data.get('mortgage_start_principal')}")
             return False
         
         if summary_data.get('mortgage_target_principal') != 280000.0:
-            print(f"   ❌ Summary target principal mismatch: expected 280000, got {summary_data.get('mortgage_target_principal')}")
+            self.echo(f"   ❌ Summary target principal mismatch: expected 280000, got {summary_data.get('mortgage_target_principal')}")
             return False
         
         if summary_data.get('latest_principal_balance') != 325000.0:
-            print(f"   ❌ Summary current principal mismatch: expected 325000, got {summary_data.get('latest_principal_balance')}")
+            self.echo(f"   ❌ Summary current principal mismatch: expected 325000, got {summary_data.get('latest_principal_balance')}")
             return False
         
-        print(f"   ✅ Mortgage summary reflects settings override")
+        self.echo(f"   ✅ Mortgage summary reflects settings override")
         
         # Test fallback to latest balance check when current_principal is null
         fallback_settings = mortgage_settings.copy()
         fallback_settings['mortgage_current_principal'] = None
         
-        success, fallback_data = self.run_test("Update Settings - Null Current Principal", "PUT", "api/settings", 200, fallback_settings)
+        success, fallback_data = await self.run_test("Update Settings - Null Current Principal", "PUT", "api/settings", 200, fallback_settings)
         if not success:
             return False
         
-        print(f"   ✅ Set current principal to null")
+        self.echo(f"   ✅ Set current principal to null")
         
         # Add a balance check to test fallback
-        today = date.today().isoformat()
+        today = self.today_iso
         balance_data = {
             "day": today,
             "principal_balance": 327500.0,
             "note": "Test balance for fallback"
         }
-        success, balance_result = self.run_test("Add Balance Check for Fallback", "POST", "api/mortgage/balance-check", 200, balance_data)
+        success, balance_result = await self.run_test("Add Balance Check for Fallback", "POST", "api/mortgage/balance-check", 200, balance_data)
         if not success:
             return False
         
         # Test summary uses latest balance check when current_principal is null
-        success, fallback_summary = self.run_test("Mortgage Summary - Fallback to Balance Check", "GET", "api/mortgage/summary", 200)
+        success, fallback_summary = await self.run_test("Mortgage Summary - Fallback to Balance Check", "GET", "api/mortgage/summary", 200)
         if not success:
             return False
         
         if fallback_summary.get('latest_principal_balance') != 327500.0:
-            print(f"   ❌ Fallback failed: expected 327500, got {fallback_summary.get('latest_principal_balance')}")
+            self.echo(f"   ❌ Fallback failed: expected 327500, got {fallback_summary.get('latest_principal_balance')}")
             return False
         
-        print(f"   ✅ Fallback to latest balance check works: ${fallback_summary.get('latest_principal_balance')}")
+        self.echo(f"   ✅ Fallback to latest balance check works: ${fallback_summary.get('latest_principal_balance')}")
         
         return True
 
-    def test_vacation_planner_calendar_features(self) -> bool:
+    async def test_vacation_planner_calendar_features(self) -> bool:
         """Test vacation planner calendar-specific features for highlighting and month jumping"""
-        print("   Testing vacation planner calendar features...")
+        self.echo("   Testing vacation planner calendar features...")
         
         # Set up a trip with specific dates for calendar testing
-        future_start = (date.today() + timedelta(days=45)).isoformat()  # About 1.5 months ahead
-        future_end = (date.today() + timedelta(days=48)).isoformat()    # 3-day trip
+        future_start = self.days_ahead_45_iso  # About 1.5 months ahead
+        future_end = self.days_ahead_48_iso    # 3-day trip
         
         trip_data = {
             "start_date": future_start,
@@ -518,135 +629,184 @@ class AccountabilityAPITester:
             "notes": "Trip specifically for testing calendar highlighting and month jumping"
         }
         
-        success, data = self.run_test("Setup Trip for Calendar Testing", "PUT", "api/relationship/trip", 200, trip_data)
+        success, data = await self.run_test("Setup Trip for Calendar Testing", "PUT", "api/relationship/trip", 200, trip_data)
         if not success:
             return False
             
-        print(f"   ✅ Set up test trip: {data.get('start_date')} → {data.get('end_date')}")
+        self.echo(f"   ✅ Set up test trip: {data.get('start_date')} → {data.get('end_date')}")
         
         # Verify the trip data is correctly stored with structured dates
-        success, trip_data = self.run_test("Verify Trip Data for Calendar", "GET", "api/relationship/trip", 200)
+        success, trip_data = await self.run_test("Verify Trip Data for Calendar", "GET", "api/relationship/trip", 200)
         if success:
             start_date = trip_data.get('start_date')
             end_date = trip_data.get('end_date')
             if start_date and end_date:
-                print(f"   ✅ Trip has structured dates: {start_date} → {end_date}")
-                print(f"   ✅ Adults-only: {trip_data.get('adults_only')}")
-                print(f"   ✅ Lodging booked: {trip_data.get('lodging_booked')}")
+                self.echo(f"   ✅ Trip has structured dates: {start_date} → {end_date}")
+                self.echo(f"   ✅ Adults-only: {trip_data.get('adults_only')}")
+                self.echo(f"   ✅ Lodging booked: {trip_data.get('lodging_booked')}")
                 return True
             else:
-                print(f"   ❌ Trip missing structured dates")
+                self.echo(f"   ❌ Trip missing structured dates")
                 return False
         return False
 
-    def test_legacy_dates_compatibility(self) -> bool:
+    async def test_legacy_dates_compatibility(self) -> bool:
         """Test that legacy dates field still works"""
         # Test update with only legacy dates field
-        legacy_trip_data = {
-            "dates": "Summer 2026 - TBD",
-            "adults_only": True,
-            "lodging_booked": False,
-            "notes": "Testing legacy dates field compatibility"
-        }
-        success, data = self.run_test("Legacy Dates Field", "PUT", "api/relationship/trip", 200, legacy_trip_data)
+        success, data = await self.run_test("Legacy Dates Field", "PUT", "api/relationship/trip", 200, LEGACY_TRIP_BODY)
         if success:
-            print(f"   Legacy dates field works: {data.get('dates')}")
-            print(f"   Structured dates remain: start={data.get('start_date')}, end={data.get('end_date')}")
+            self.echo(f"   Legacy dates field works: {data.get('dates')}")
+            self.echo(f"   Structured dates remain: start={data.get('start_date')}, end={data.get('end_date')}")
             return True
         return False
 
-    def test_weekly_review(self) -> bool:
+    async def test_weekly_review(self) -> bool:
         """Test weekly review endpoint"""
-        today = date.today().isoformat()
+        today = self.today_iso
         
-        success, data = self.run_test("Weekly Review", "GET", "api/review/weekly", 200,
+        success, data = await self.run_test("Weekly Review", "GET", "api/review/weekly", 200,
                                     params={"anchor_day": today})
         if success:
-            print(f"   Week: {data.get('week_start')} to {data.get('week_end')}")
-            print(f"   Wakeups ≥4: {data.get('wakeups_ge_4')}")
-            print(f"   Workouts ≥5: {data.get('workouts_completed_5')}")
-            print(f"   Video ≥1: {data.get('captured_at_least_1_video')}")
+            try:
+                self.echo(
+                    f"   Week: {data['week_start']} to {data['week_end']}\n"
+                    f"   Wakeups ≥4: {data['wakeups_ge_4']}\n"
+                    f"   Workouts ≥5: {data['workouts_completed_5']}\n"
+                    f"   Video ≥1: {data['captured_at_least_1_video']}"
+                )
+            except KeyError as e:
+                self.echo(f"   Missing response field: {e}")
             return True
         return False
 
-    def test_admin_reset_flow(self) -> bool:
+    async def test_admin_reset_flow(self) -> bool:
         """Test admin reset endpoint with validation - CRITICAL FEATURE"""
-        print("   Testing reset endpoint validation...")
+        self.echo("   Testing reset endpoint validation...")
         
         # Test with wrong confirmation value
-        success, data = self.run_test("Admin Reset - Wrong Confirm", "POST", "api/admin/reset", 400,
+        success, data = await self.run_test("Admin Reset - Wrong Confirm", "POST", "api/admin/reset", 400,
                                     params={"confirm": "WRONG"})
         if success:
-            print(f"   ✅ Correctly rejected wrong confirm value")
+            self.echo(f"   ✅ Correctly rejected wrong confirm value")
         else:
-            print(f"   ❌ Should have rejected wrong confirm value")
+            self.echo(f"   ❌ Should have rejected wrong confirm value")
             return False
         
         # Test with empty confirmation
-        success, data = self.run_test("Admin Reset - Empty Confirm", "POST", "api/admin/reset", 400,
+        success, data = await self.run_test("Admin Reset - Empty Confirm", "POST", "api/admin/reset", 400,
                                     params={"confirm": ""})
         if success:
-            print(f"   ✅ Correctly rejected empty confirm value")
+            self.echo(f"   ✅ Correctly rejected empty confirm value")
         else:
-            print(f"   ❌ Should have rejected empty confirm value")
+            self.echo(f"   ❌ Should have rejected empty confirm value")
             return False
         
         # Test with correct confirmation value
-        success, data = self.run_test("Admin Reset - Correct Confirm", "POST", "api/admin/reset", 200,
+        success, data = await self.run_test("Admin Reset - Correct Confirm", "POST", "api/admin/reset", 200,
                                     params={"confirm": "RESET"})
         if success:
-            print(f"   ✅ Reset successful: {data.get('ok')}")
+            self.echo(f"   ✅ Reset successful: {data.get('ok')}")
             deleted = data.get('deleted', {})
-            print(f"   Deleted collections: {deleted}")
-            print(f"   Note: {data.get('note', '')}")
+            self.echo(f"   Deleted collections: {deleted}")
+            self.echo(f"   Note: {data.get('note', '')}")
             return True
         return False
 
-    def run_all_tests(self) -> Dict[str, Any]:
+    async def probe_backend(self) -> bool:
+        """One cheap health request up front, so a down backend fails the run immediately"""
+        try:
+            await self.client.get(self.urls["api/health"], timeout=PROBE_TIMEOUT_SECONDS)
+        except httpx.TransportError as e:
+            self.log_test("Backend Reachable", False, f"Exception: {str(e)}")
+            return False
+        return True
+
+    async def run_serial(self, flows: Dict[str, Callable[[], Awaitable[bool]]]) -> Dict[str, bool]:
+        """Run dependent flows one after another, in order, each with its output buffered"""
+        results = {}
+        for name, flow in flows.items():
+            with buffered_output():
+                # A flow that raises fails on its own instead of cancelling the other
+                # concurrent groups
+                try:
+                    results[name] = await flow()
+                except Exception as e:
+                    self.log_test(f"{name} flow", False, f"Exception: {str(e)}")
+                    results[name] = False
+        return results
+
+    async def run_all_tests(self) -> Dict[str, Any]:
         """Run all tests and return results"""
-        print("🚀 Starting 2026 Accountability Tracker API Tests")
-        print(f"Testing against: {self.base_url}")
-        print("=" * 60)
-        
-        # Test password protection first (critical for security)
-        test_results = {
-            "password_protection": self.test_password_protection(),
-            "password_integration": self.test_password_integration_flow(),
-        }
-        
-        # If password protection is working, continue with other tests
-        if test_results["password_protection"] and test_results["password_integration"]:
-            # Set password header for all subsequent tests
-            self.session.headers.update({"x-app-password": self.correct_password})
-            
-            # Test each component
-            test_results.update({
-                "health": self.test_health(),
-                "summary": self.test_summary(),
-                "checkin": self.test_checkin_flow(),
-                "fitness": self.test_fitness_flow(),
-                "mortgage": self.test_mortgage_flow(),
-                "relationship": self.test_relationship_flow(),
-                "vacation_calendar_features": self.test_vacation_planner_calendar_features(),
-                "legacy_compatibility": self.test_legacy_dates_compatibility(),
-                "settings": self.test_settings_flow(),
-                "mortgage_settings": self.test_mortgage_settings_flow(),
-                "weekly_review": self.test_weekly_review(),
-                "admin_reset": self.test_admin_reset_flow()
+        with buffered_output():
+            self.echo("🚀 Starting 2026 Accountability Tracker API Tests")
+            self.echo(f"Testing against: {self.base_url}")
+            self.echo("=" * 60)
+        
+        test_results: Dict[str, bool] = {}
+        with buffered_output():
+            reachable = await self.probe_backend()
+            if not reachable:
+                self.echo("❌ Backend unreachable - skipping all tests")
+
+        if reachable:
+            # Test password protection first (critical for security)
+            test_results = await self.run_serial({
+                "password_protection": self.test_password_protection,
+                "password_integration": self.test_password_integration_flow,
             })
-        else:
-            print("❌ Password protection tests failed - skipping other tests")
-        
-        print("=" * 60)
-        print(f"📊 Test Results: {self.tests_passed}/{self.tests_run} passed")
         
-        if self.failed_tests:
-            print("\n❌ Failed Tests:")
-            for test in self.failed_tests:
-                print(f"   • {test['name']}: {test['details']}")
+            # If password protection is working, continue with other tests
+            if test_results["password_protection"] and test_results["password_integration"]:
+                # Set password header for all subsequent tests
+                self.client.headers.update({"x-app-password": self.correct_password})
+            
+                # Health and summary are read-only, so they can run together
+                for group in await asyncio.gather(
+                    self.run_serial({"health": self.test_health}),
+                    self.run_serial({"summary": self.test_summary}),
+                ):
+                    test_results.update(group)
+
+                # Test each component. Independent flows run concurrently; flows that share
+                # server state run as one serial group, in dependency order.
+                groups = await asyncio.gather(
+                    self.run_serial({"checkin": self.test_checkin_flow}),
+                    self.run_serial({"fitness": self.test_fitness_flow}),
+                    self.run_serial({"weekly_review": self.test_weekly_review}),
+                    # All three PUT the single trip doc; legacy checks the dates vacation left
+                    self.run_serial({
+                        "relationship": self.test_relationship_flow,
+                        "vacation_calendar_features": self.test_vacation_planner_calendar_features,
+                        "legacy_compatibility": self.test_legacy_dates_compatibility,
+                    }),
+                    # settings PUTs rewrite the mortgage fields, and mortgage_settings asserts on
+                    # the latest balance check, so it runs after the other balance-check writer
+                    self.run_serial({
+                        "mortgage": self.test_mortgage_flow,
+                        "settings": self.test_settings_flow,
+                        "mortgage_settings": self.test_mortgage_settings_flow,
+                    }),
+                )
+                for group in groups:
+                    test_results.update(group)
+
+                # Wipes all data, so it runs last and alone
+                test_results.update(await self.run_serial({"admin_reset": self.test_admin_reset_flow}))
+            else:
+                self.echo("❌ Password protection tests failed - skipping other tests")
         
+        self.tally()
         success_rate = (self.tests_passed / self.tests_run * 100) if self.tests_run > 0 else 0
-        print(f"Success Rate: {success_rate:.1f}%")
+        with buffered_output():
+            self.echo("=" * 60)
+            self.echo(f"📊 Test Results: {self.tests_passed}/{self.tests_run} passed")
+            
+            if self.failed_tests:
+                self.echo("\n❌ Failed Tests:")
+                for test in self.failed_tests:
+                    self.echo(f"   • {test.name}: {test.details}")
+            
+            self.echo(f"Success Rate: {success_rate:.1f}%")
         
         return {
             "total_tests": self.tests_run,
@@ -654,13 +814,19 @@ class AccountabilityAPITester:
             "failed_tests": len(self.failed_tests),
             "success_rate": success_rate,
             "test_results": test_results,
-            "failed_details": self.failed_tests
+            "failed_details": [test._asdict() for test in self.failed_tests]
         }
 
+async def run() -> Dict[str, Any]:
+    tester = AccountabilityAPITester()
+    try:
+        return await tester.run_all_tests()
+    finally:
+        await tester.client.aclose()
+
 def main():
     """Main test runner"""
-    tester = AccountabilityAPITester()
-    results = tester.run_all_tests()
+    results = asyncio.run(run())
     
     # Return appropriate exit code
     return 0 if results["failed_tests"] == 0 else 1